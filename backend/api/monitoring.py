@@ -7,6 +7,7 @@ import os
 from datetime import datetime
 from typing import Dict, Any
 from fastapi import APIRouter
+from starlette.concurrency import run_in_threadpool
 from backend.config import settings
 from backend.utils.security import check_api_keys_status
 
@@ -26,6 +27,24 @@ except ImportError:
     logger.warning("psutil이 설치되지 않아 시스템 메트릭 수집이 제한됩니다.")
 
 
+def _collect_process_info(detailed: bool = False) -> Dict[str, Any]:
+    """
+    현재 프로세스 리소스 정보 수집
+
+    cpu_percent(interval=0.1)는 0.1초 동안 블로킹되므로
+    이벤트 루프가 아닌 스레드풀에서 호출해야 합니다.
+    """
+    process = psutil.Process(os.getpid())
+    info = {
+        "cpu_percent": process.cpu_percent(interval=0.1),
+        "memory_mb": round(process.memory_info().rss / 1024 / 1024, 2),
+    }
+    if detailed:
+        info["memory_percent"] = round(process.memory_percent(), 2)
+        info["num_threads"] = process.num_threads()
+    return info
+
+
 @router.get("/health")
 async def health_check() -> Dict[str, Any]:
     """
@@ -42,11 +61,7 @@ async def health_check() -> Dict[str, Any]:
         }
         if PSUTIL_AVAILABLE:
             try:
-                process = psutil.Process(os.getpid())
-                system_info.update({
-                    "cpu_percent": process.cpu_percent(interval=0.1),
-                    "memory_mb": round(process.memory_info().rss / 1024 / 1024, 2),
-                })
+                system_info.update(await run_in_threadpool(_collect_process_info))
             except Exception as e:
                 logger.warning(f"시스템 정보 수집 실패: {e}")
                 system_info["error"] = "시스템 정보를 수집할 수 없습니다"
@@ -56,7 +71,7 @@ async def health_check() -> Dict[str, Any]:
             "status": "healthy",
             "timestamp": datetime.now().isoformat(),
             "version": "1.0.0",
-            "environment": "production" if os.environ.get("VERCEL") == "1" else "development",
+            "environment": "production" if settings.is_vercel else "development",
             "api_keys": {
                 "openai_configured": api_key_status["openai_configured"],
                 "gemini_configured": api_key_status["gemini_configured"]
@@ -98,13 +113,7 @@ async def get_metrics() -> Dict[str, Any]:
         # 시스템 메트릭 (가능한 경우)
         if PSUTIL_AVAILABLE:
             try:
-                process = psutil.Process(os.getpid())
-                metrics["system"] = {
-                    "cpu_percent": process.cpu_percent(interval=0.1),
-                    "memory_mb": round(process.memory_info().rss / 1024 / 1024, 2),
-                    "memory_percent": round(process.memory_percent(), 2),
-                    "num_threads": process.num_threads()
-                }
+                metrics["system"] = await run_in_threadpool(_collect_process_info, True)
             except Exception as e:
                 logger.warning(f"시스템 메트릭 수집 실패: {e}")
                 metrics["system"] = {"error": "메트릭을 수집할 수 없습니다"}
@@ -6,12 +6,13 @@ import logging
 import json
 from typing import Optional, List
 from fastapi import APIRouter, HTTPException, Body, Query
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 
 from backend.services.target_analyzer import analyze_target, analyze_target_stream
 from backend.services.sentiment_analyzer import analyze_sentiment, analyze_context, analyze_tone
 from backend.services.keyword_recommender import recommend_keywords
 from backend.services.progress_tracker import create_progress_tracker, get_progress_tracker, remove_progress_tracker
+from backend.utils.report_markdown import render_report_markdown
 from backend.utils.error_handler import (
     handle_api_error,
     validate_target_type,
@@ -155,6 +156,7 @@ async def analyze_target_stream_endpoint(
     **응답 형식:**
     - MECE 구조의 상세 분석 결과
     - Executive Summary, Key Findings, Detailed Analysis, Strategic Recommendations 포함
+    - `?format=markdown` 지정 시 JSON 대신 Markdown 보고서(`text/markdown`) 반환
     
     **예시 요청:**
     ```json
@@ -179,7 +181,8 @@ async def analyze_target_endpoint(
     start_date: Optional[str] = Body(None, description="분석 시작일 (YYYY-MM-DD 형식)", example="2025-01-01"),
     end_date: Optional[str] = Body(None, description="분석 종료일 (YYYY-MM-DD 형식)", example="2025-01-31"),
     include_sentiment: bool = Body(True, description="정성적 분석 포함 여부", example=True),
-    include_recommendations: bool = Body(True, description="키워드 추천 포함 여부", example=True)
+    include_recommendations: bool = Body(True, description="키워드 추천 포함 여부", example=True),
+    response_format: str = Query("json", alias="format", pattern="^(json|markdown)$", description="응답 형식: json 또는 markdown")
 ):
     """AI를 사용하여 타겟 분석을 수행합니다. 정성적 분석 및 키워드 추천 옵션 포함."""
     progress_tracker = None
@@ -283,6 +286,13 @@ async def analyze_target_endpoint(
             except Exception as e:
                 logger.warning(f"Progress tracker 정리 실패: {e}")
         
+        # 보고서 스크립트를 실행하지 않는 클라이언트용 서버 측 Markdown 보고서
+        if response_format == "markdown":
+            return Response(
+                content=render_report_markdown(result, target_keyword, target_type),
+                media_type="text/markdown"
+            )
+        
         return {
             "success": True,
             "data": result
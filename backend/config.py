@@ -2,9 +2,13 @@
 설정 관리 모듈
 """
 import os
+from functools import cached_property
 from pathlib import Path
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import Optional, Tuple
+
+# Vercel 배포 환경에서 허용하는 유일한 출처
+VERCEL_PRODUCTION_ORIGIN = "https://news-trend-analyzer.vercel.app"
 
 
 class Settings(BaseSettings):
@@ -14,6 +18,11 @@ class Settings(BaseSettings):
     HOST: str = "0.0.0.0"
     PORT: int = 8000
     DEBUG: bool = True
+    WORKERS: int = os.cpu_count() or 1  # 운영 실행 시 Uvicorn 워커 수 (DEBUG 모드에서는 1)
+    TIMEOUT_KEEP_ALIVE: int = 30  # keep-alive 유지 시간 (초, 프록시 유휴 타임아웃보다 길게)
+    
+    # CORS 설정 (쉼표로 구분된 허용 출처 목록)
+    ALLOWED_ORIGINS: str = "http://localhost:3000"
     
     # 뉴스 API 설정 (선택사항)
     NEWS_API_KEY: Optional[str] = None
@@ -64,10 +73,15 @@ class Settings(BaseSettings):
     CACHE_TTL: int = 3600  # 초 단위
     CACHE_MAX_ENTRIES: int = 500
     CACHE_CLEANUP_INTERVAL: int = 100
+    REDIS_URL: Optional[str] = None  # 설정 시 여러 워커가 Redis 캐시를 공유
 
     # 응답 압축 설정
     GZIP_ENABLED: bool = True
     GZIP_MINIMUM_SIZE: int = 1000
+    GZIP_COMPRESS_LEVEL: int = 5  # 1~9 (JSON 응답은 5 정도면 압축률 대비 CPU 비용이 적절)
+    
+    # 스레드풀 설정 (동기 LLM SDK 호출 등 블로킹 작업용)
+    THREADPOOL_SIZE: int = 200
     
     # 로깅 설정
     LOG_LEVEL: str = "INFO"
@@ -78,6 +92,18 @@ class Settings(BaseSettings):
     MAX_OUTPUT_TOKENS: int = 3000  # 최대 출력 토큰 수
     CACHE_TTL_FRONTEND: int = 30000  # 프론트엔드 캐시 TTL (밀리초)
     
+    @cached_property
+    def is_vercel(self) -> bool:
+        """Vercel 배포 환경 여부"""
+        return os.environ.get("VERCEL") == "1"
+    
+    @cached_property
+    def allowed_origins(self) -> Tuple[str, ...]:
+        """CORS 허용 출처 (한 번만 파싱, Vercel에서는 프로덕션 도메인만 허용)"""
+        if self.is_vercel:
+            return (VERCEL_PRODUCTION_ORIGIN,)
+        return tuple(origin.strip() for origin in self.ALLOWED_ORIGINS.split(",") if origin.strip())
+    
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -90,7 +116,7 @@ class Settings(BaseSettings):
 settings = Settings()
 
 # Vercel 환경에서 환경 변수를 다시 확인하고 업데이트 (이중 체크)
-IS_VERCEL = os.environ.get("VERCEL") == "1"
+IS_VERCEL = settings.is_vercel
 if IS_VERCEL:
     # Vercel 환경에서는 환경 변수를 직접 확인
     if os.getenv("OPENAI_API_KEY") and not settings.OPENAI_API_KEY:
@@ -127,6 +153,7 @@ RAW_DATA_DIR = DATA_DIR / "raw"
 PROCESSED_DATA_DIR = DATA_DIR / "processed"
 CACHE_DIR = DATA_DIR / "cache"
 ASSETS_DIR = BASE_DIR / "frontend" / "public" / "assets"
+STATIC_DIR = BASE_DIR / "backend" / "static"  # 랜딩 페이지 등 서버가 직접 제공하는 정적 파일
 LOGS_DIR = BASE_DIR / "logs"
 EXPORTS_DIR = BASE_DIR / "exports"  # 분석 결과 내보내기용
 
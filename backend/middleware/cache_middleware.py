@@ -1,38 +1,51 @@
 """
 캐싱 미들웨어
 API 응답을 캐싱하여 성능을 향상시킵니다.
+
+BaseHTTPMiddleware 대신 순수 ASGI 미들웨어로 구현하여
+요청마다 Request/Response 객체나 별도 태스크를 만들지 않습니다.
 """
-import hashlib
-import json
 import logging
-from typing import Callable
+from typing import Iterable, Optional, Tuple
 from datetime import datetime, timedelta
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
-from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from backend.middleware.redis_cache_backend import RedisCacheBackend
 
 logger = logging.getLogger(__name__)
 
+# 캐싱하면 안 되는 경로: 실시간 스트리밍, 캐시/메트릭 통계 (캐시되면 값이 고정됨)
+DEFAULT_SKIP_PREFIXES = (
+    "/api/target/analyze/stream",
+    "/api/cache",
+    "/api/metrics",
+)
+
 
-class CacheMiddleware(BaseHTTPMiddleware):
+class CacheMiddleware:
     """캐싱 미들웨어 클래스"""
     
     def __init__(
         self,
-        app,
+        app: ASGIApp,
         duration: int = 3600,
         max_entries: int = 500,
         cleanup_interval: int = 100,
+        skip_prefixes: Iterable[str] = DEFAULT_SKIP_PREFIXES,
+        backend: Optional[RedisCacheBackend] = None,
     ):
         """
         Args:
-            app: FastAPI 애플리케이션
+            app: ASGI 애플리케이션
             duration: 캐시 유지 시간 (초)
             max_entries: 최대 캐시 엔트리 수
             cleanup_interval: N개 요청마다 만료 캐시 정리
+            skip_prefixes: 캐싱하지 않을 경로 접두사 (스트리밍/통계 등)
+            backend: 워커 간 공유 캐시 백엔드 (None이면 프로세스 내 딕셔너리 사용)
         """
-        super().__init__(app)
+        self.app = app
+        # str.startswith에 그대로 넘길 수 있도록 튜플로 고정
+        self.skip_prefixes = tuple(skip_prefixes)
+        self.backend = backend
         self.cache: dict = {}
         self.duration = duration
         self.max_entries = max_entries
@@ -40,6 +53,10 @@ class CacheMiddleware(BaseHTTPMiddleware):
         self._request_count = 0
         self._cache_hits = 0
         self._cache_misses = 0
+        self._hit_headers = [
+            (b"x-cache", b"HIT"),
+            (b"x-cache-ttl", str(duration).encode("latin-1")),
+        ]
 
         # 캐시 메트릭 전역 저장 (모니터링 API 용)
         set_cache_metrics(
@@ -53,107 +70,126 @@ class CacheMiddleware(BaseHTTPMiddleware):
         # 전역 저장소에 참조 저장 (함수는 파일 하단에 정의됨)
         set_cache_store(self.cache)
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """요청 처리 및 캐싱"""
         
-        # API GET 요청만 캐싱
-        if request.method != "GET" or not request.url.path.startswith("/api"):
-            return await call_next(request)
-
-        # 스트리밍/실시간 경로 제외
-        if request.url.path.startswith("/api/target/analyze/stream"):
-            return await call_next(request)
+        # API GET 요청만 캐싱 (스트리밍/통계 경로 제외) - 캐시 키 계산 전에 빠르게 통과
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or not scope["path"].startswith("/api")
+            or scope["path"].startswith(self.skip_prefixes)
+        ):
+            await self.app(scope, receive, send)
+            return
 
         # 클라이언트 캐시 무효화 요청 지원
-        cache_control = request.headers.get("cache-control", "")
-        if "no-store" in cache_control or "no-cache" in cache_control:
-            return await call_next(request)
+        request_headers = dict(scope["headers"])
+        cache_control = request_headers.get(b"cache-control", b"")
+        if b"no-store" in cache_control or b"no-cache" in cache_control:
+            await self.app(scope, receive, send)
+            return
 
         self._request_count += 1
         
         # 캐시 키 생성
-        cache_key = self._generate_cache_key(request)
+        cache_key = self._generate_cache_key(scope, request_headers)
         
         # 캐시 확인
-        if cache_key in self.cache:
-            cached_data = self.cache[cache_key]
-            
-            # 캐시 만료 확인
-            if datetime.now() < cached_data["expires_at"]:
-                logger.debug(f"캐시 히트: {cache_key}")
-                self._cache_hits += 1
-                self._sync_metrics()
-                return JSONResponse(
-                    content=cached_data["data"],
-                    headers={"X-Cache": "HIT", "X-Cache-TTL": str(self.duration)}
-                )
-            else:
-                # 만료된 캐시 제거
-                del self.cache[cache_key]
-                logger.debug(f"캐시 만료: {cache_key}")
+        cached = await self._lookup(cache_key)
+        if cached is not None:
+            logger.debug(f"캐시 히트: {cache_key}")
+            self._cache_hits += 1
+            self._sync_metrics()
+            status, headers, body = cached
+            await send({
+                "type": "http.response.start",
+                "status": status,
+                "headers": headers + self._hit_headers,
+            })
+            await send({"type": "http.response.body", "body": body})
+            return
 
         self._cache_misses += 1
         self._sync_metrics()
         
-        # 원본 요청 처리
-        response = await call_next(request)
-        
-        # 성공 응답만 캐싱
-        if response.status_code == 200:
-            try:
-                # 응답 본문 읽기
-                response_body = b""
-                async for chunk in response.body_iterator:
-                    response_body += chunk
-                
-                # JSON 파싱
-                try:
-                    data = json.loads(response_body.decode())
-                except json.JSONDecodeError:
-                    # JSON이 아니면 캐싱하지 않음
-                    return Response(
-                        content=response_body,
-                        status_code=response.status_code,
-                        headers=dict(response.headers)
-                    )
-                
-                # 주기적 만료 캐시 정리
-                if self._request_count % self.cleanup_interval == 0:
-                    self._cleanup_expired_entries()
-
-                # 엔트리 수 상한 관리 (오래된 항목 제거)
-                if len(self.cache) >= self.max_entries:
-                    self._evict_oldest_entry()
-
-                # 캐시 저장
-                self.cache[cache_key] = {
-                    "data": data,
-                    "expires_at": datetime.now() + timedelta(seconds=self.duration),
-                    "created_at": datetime.now()
-                }
-                
-                logger.debug(f"캐시 저장: {cache_key}")
-                
-                # 응답 재생성
-                return JSONResponse(
-                    content=data,
-                    headers={**dict(response.headers), "X-Cache": "MISS"}
-                )
-                
-            except Exception as e:
-                logger.error(f"캐싱 중 오류: {e}")
-                return response
-        
-        return response
+        # 원본 요청 처리 (성공한 JSON 응답만 본문을 모아 캐싱)
+        response_headers: Optional[list] = None
+        body_parts = []
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_headers
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                if message["status"] == 200 and self._is_json(headers):
+                    response_headers = headers
+                    message["headers"] = headers + [(b"x-cache", b"MISS")]
+            elif message["type"] == "http.response.body" and response_headers is not None:
+                body_parts.append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    await self._store(cache_key, response_headers, b"".join(body_parts))
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    @staticmethod
+    def _is_json(headers: list) -> bool:
+        """JSON 응답 여부 (JSON이 아니면 캐싱하지 않음)"""
+        for name, value in headers:
+            if name == b"content-type":
+                return value.startswith(b"application/json")
+        return False
+
+    async def _lookup(self, cache_key: Tuple) -> Optional[Tuple[int, list, bytes]]:
+        """캐시된 (상태, 헤더, 본문) 조회 (없거나 만료 시 None)"""
+        if self.backend is not None:
+            return await self.backend.get(cache_key)
+
+        cached_data = self.cache.get(cache_key)
+        if cached_data is None:
+            return None
+        # 캐시 만료 확인
+        if datetime.now() >= cached_data["expires_at"]:
+            # 만료된 캐시 제거
+            del self.cache[cache_key]
+            logger.debug(f"캐시 만료: {cache_key}")
+            return None
+        return cached_data["status"], cached_data["headers"], cached_data["body"]
+
+    async def _store(self, cache_key: Tuple, headers: list, body: bytes):
+        """응답을 (상태, 헤더, 본문) 형태로 캐시에 저장"""
+        if self.backend is not None:
+            await self.backend.set(cache_key, 200, headers, body, ttl=self.duration)
+            return
+
+        # 주기적 만료 캐시 정리
+        if self._request_count % self.cleanup_interval == 0:
+            self._cleanup_expired_entries()
+
+        # 엔트리 수 상한 관리 (오래된 항목 제거)
+        if len(self.cache) >= self.max_entries:
+            self._evict_oldest_entry()
+
+        now = datetime.now()
+        self.cache[cache_key] = {
+            "status": 200,
+            "headers": headers,
+            "body": body,
+            "expires_at": now + timedelta(seconds=self.duration),
+            "created_at": now
+        }
+        logger.debug(f"캐시 저장: {cache_key}")
     
-    def _generate_cache_key(self, request: Request) -> str:
+    def _generate_cache_key(self, scope: Scope, request_headers: dict) -> Tuple:
         """캐시 키 생성"""
-        # URL과 쿼리 파라미터를 기반으로 키 생성
-        url = str(request.url)
-        key_string = f"{request.method}:{url}"
-        
-        # 해시 생성
-        return hashlib.md5(key_string.encode()).hexdigest()
+        # 경로와 쿼리 파라미터를 기반으로 키 생성
+        # 하위 GZip 미들웨어가 본문을 압축할 수 있으므로 Accept-Encoding별로 구분
+        return (
+            scope["method"],
+            scope.get("raw_path") or scope["path"].encode(),
+            scope["query_string"],
+            request_headers.get(b"accept-encoding", b""),
+        )
     
     def clear_cache(self):
         """캐시 전체 삭제"""
@@ -0,0 +1,37 @@
+"""
+GZip 압축 미들웨어 (스트리밍 경로 제외)
+
+Starlette GZipMiddleware는 스트리밍 응답 청크를 압축기에 쓰기만 하고 flush하지 않으므로,
+작은 NDJSON 줄은 압축 버퍼에 쌓여 있다가 스트림이 끝날 때 한꺼번에 전송됩니다.
+문장 단위 실시간 출력이 필요한 경로는 압축 없이 그대로 통과시킵니다.
+"""
+from typing import Iterable
+
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+# 압축하면 안 되는 경로: 청크를 즉시 전달해야 하는 실시간 스트리밍
+DEFAULT_SKIP_PREFIXES = (
+    "/api/target/analyze/stream",
+)
+
+
+class StreamingAwareGZipMiddleware(GZipMiddleware):
+    """스트리밍 경로 접두사는 압축하지 않는 GZipMiddleware"""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 500,
+        compresslevel: int = 9,
+        skip_prefixes: Iterable[str] = DEFAULT_SKIP_PREFIXES,
+    ) -> None:
+        super().__init__(app, minimum_size=minimum_size, compresslevel=compresslevel)
+        # str.startswith에 그대로 넘길 수 있도록 튜플로 고정
+        self.skip_prefixes = tuple(skip_prefixes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"].startswith(self.skip_prefixes):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
@@ -0,0 +1,85 @@
+"""
+Redis 캐시 백엔드
+여러 Uvicorn 워커가 CacheMiddleware의 캐시를 공유할 수 있도록 합니다.
+(REDIS_URL이 설정되고 redis 패키지가 설치된 경우에만 사용)
+"""
+import hashlib
+import logging
+from typing import List, Optional, Tuple
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# redis 임포트 (선택적)
+try:
+    import redis.asyncio as redis_asyncio
+    REDIS_AVAILABLE = True
+except ImportError:
+    redis_asyncio = None
+    REDIS_AVAILABLE = False
+
+CachedResponse = Tuple[int, List[Tuple[bytes, bytes]], bytes]
+
+
+class RedisCacheBackend:
+    """
+    (상태, 헤더, 본문) 응답을 Redis에 저장하는 캐시 백엔드
+
+    저장 형식: 메타데이터 JSON 한 줄 + 원본 본문 bytes
+    (pickle을 쓰지 않으므로 공유 Redis에서도 역직렬화가 안전함)
+    Redis 오류는 캐시 미스로 처리하여 요청 자체는 실패하지 않도록 합니다.
+    """
+
+    def __init__(self, url: str, prefix: str = "news-analysis:cache:"):
+        if not REDIS_AVAILABLE:
+            raise RuntimeError("redis 패키지가 설치되지 않았습니다.")
+        self.client = redis_asyncio.from_url(url)
+        self.prefix = prefix
+
+    def _redis_key(self, cache_key: Tuple) -> str:
+        """캐시 키 튜플을 Redis 키 문자열로 변환"""
+        raw = b"\0".join(
+            part if isinstance(part, bytes) else str(part).encode()
+            for part in cache_key
+        )
+        return self.prefix + hashlib.md5(raw).hexdigest()
+
+    async def get(self, cache_key: Tuple) -> Optional[CachedResponse]:
+        """캐시된 응답 조회 (없거나 오류 시 None)"""
+        try:
+            value = await self.client.get(self._redis_key(cache_key))
+        except Exception as e:
+            logger.warning(f"Redis 캐시 조회 실패: {e}")
+            return None
+        if value is None:
+            return None
+
+        meta, _, body = value.partition(b"\n")
+        meta = orjson.loads(meta)
+        headers = [
+            (name.encode("latin-1"), header_value.encode("latin-1"))
+            for name, header_value in meta["headers"]
+        ]
+        return meta["status"], headers, body
+
+    async def set(
+        self,
+        cache_key: Tuple,
+        status: int,
+        headers: List[Tuple[bytes, bytes]],
+        body: bytes,
+        ttl: int
+    ):
+        """응답을 TTL과 함께 저장"""
+        meta = orjson.dumps({
+            "status": status,
+            "headers": [
+                (name.decode("latin-1"), value.decode("latin-1"))
+                for name, value in headers
+            ],
+        })
+        try:
+            await self.client.set(self._redis_key(cache_key), meta + b"\n" + body, ex=ttl)
+        except Exception as e:
+            logger.warning(f"Redis 캐시 저장 실패: {e}")
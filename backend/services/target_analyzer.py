@@ -7,11 +7,12 @@ import logging
 import re
 from typing import Optional, Dict, Any, AsyncGenerator
 import json
+from starlette.concurrency import iterate_in_threadpool
 
 from backend.config import settings
 
 # Vercel 환경 확인
-IS_VERCEL = os.environ.get("VERCEL") == "1"
+IS_VERCEL = settings.is_vercel
 from backend.services.progress_tracker import ProgressTracker
 from backend.utils.token_optimizer import (
     optimize_prompt, estimate_tokens, get_max_tokens_for_model, optimize_additional_context,
@@ -2052,8 +2053,9 @@ async def _analyze_with_gemini_stream(
                 logger=logger,
             )
             
-            # 스트리밍 응답 처리
-            for chunk in response_stream:
+            # 스트리밍 응답 처리 (동기 이터레이터의 네트워크 대기가 이벤트 루프를 막지 않도록 스레드풀에서 순회)
+            # iterate_in_threadpool은 next()만 호출하므로 iterable 응답 객체는 iter()로 감싸서 전달
+            async for chunk in iterate_in_threadpool(iter(response_stream)):
                 text = None
                 if hasattr(chunk, 'text'):
                     text = chunk.text
@@ -2109,7 +2111,8 @@ async def _analyze_with_gemini_stream(
             
             response_stream = await loop.run_in_executor(None, generate_stream_old)
             
-            for chunk in response_stream:
+            # GenerateContentResponse는 iterable이지만 이터레이터는 아니므로 iter()로 감싸서 순회
+            async for chunk in iterate_in_threadpool(iter(response_stream)):
                 text = None
                 if hasattr(chunk, 'text'):
                     text = chunk.text
@@ -0,0 +1,2239 @@
+// 상세 디버그 로그 (app.js 로드 전에 window.__NEWS_ANALYSIS_DEBUG__ = true로 설정한 경우에만 출력)
+const DEBUG = window.__NEWS_ANALYSIS_DEBUG__ === true;
+
+// 무시해도 되는 브라우저 확장 프로그램 오류 패턴 (하나의 정규식으로 결합하여 한 번만 검사)
+const IGNORED_ERROR_RE = /message channel closed|asynchronous response|Extension context invalidated|Receiving end does not exist|liner-core|Violation/i;
+
+// YYYY-MM-DD 형식 정규식
+const DATE_RE = /^\d{4}-\d{2}-\d{2}$/;
+
+// 허용된 target_type 값
+const ALLOWED_TYPES = new Set(["keyword", "audience", "comprehensive"]);
+
+// 분석 단계별 예상 진행률 (step이 null인 단계는 사용하는 AI 제공자에 따라 문구 결정)
+const ANALYSIS_STEPS = Object.freeze([
+    { progress: 5, step: "분석 준비 중..." },
+    { progress: 10, step: "프롬프트 생성 중..." },
+    { progress: 15, step: null },
+    { progress: 30, step: "AI API 요청 전송 중..." },
+    { progress: 50, step: "AI 응답 대기 중..." },
+    { progress: 70, step: "AI 응답 수신 완료, 결과 파싱 중..." },
+    { progress: 80, step: "JSON 파싱 완료, 결과 정리 중..." },
+    { progress: 90, step: "정성적 분석 수행 중..." },
+    { progress: 95, step: "키워드 추천 생성 중..." },
+    { progress: 100, step: "분석 완료" }
+].map(Object.freeze));
+
+// 스트리밍 섹션 헤더
+const SECTION_HEADERS = Object.freeze({
+    "executive_summary": "## Executive Summary\n\n",
+    "key_findings": "\n## Key Findings\n\n",
+    "detailed_analysis": "\n## Detailed Analysis\n\n",
+    "strategic_recommendations": "\n## Strategic Recommendations\n\n"
+});
+
+// 기본 분석 모드(API 키 미설정) 경고 문구 (보고서 본문에서 제외)
+const WARNING_RE = /⚠️ AI API 키가 설정되지 않아|기본 분석 모드|AI API를 설정하면/;
+
+// 응답에 포함될 수 있는 한글/영문 섹션 키
+const KOREAN_SECTION_KEYS = new Set(["Executive Summary", "분석 개요", "Key Insights", "오디언스 상세 분석", "전략 제안", "실행 로드맵", "리스크 & 거버넌스", "부록"]);
+
+// 응답 앞뒤를 감싼 마크다운 코드 블록 표시 (```json ... ```)
+const FENCE_RE = /^\s*```(?:json)?\s*|\s*```\s*$/g;
+
+// 분석 유형 표시 이름
+const TYPE_NAMES = Object.freeze({
+    "keyword": "키워드",
+    "audience": "오디언스",
+    "comprehensive": "종합"
+});
+
+// 보고서 "분석 일시" 포맷 (toLocaleString("ko-KR")과 같은 형식, 로캘 데이터를 매번 다시 읽지 않도록 한 번만 생성)
+const REPORT_DATE_FORMAT = new Intl.DateTimeFormat("ko-KR", {
+    year: "numeric", month: "numeric", day: "numeric",
+    hour: "numeric", minute: "numeric", second: "numeric"
+});
+
+// 영문 키 -> snake_case 키 매핑 (키워드/오디언스/종합 공통)
+const ENGLISH_KEY_MAPPING = Object.freeze({
+    "Executive Summary": "executive_summary",
+    "Analysis Overview": "analysis_overview",
+    "Key Insights": "key_insights",
+    "Key Findings": "key_findings",
+    "Audience Detailed Analysis": "detailed_audience_analysis",
+    "Strategic Recommendations": "strategic_recommendations",
+    "Execution Roadmap": "execution_roadmap",
+    "Risks & Governance": "risk_governance",
+    "Appendix": "appendix"
+});
+
+// 한글 키 -> snake_case/영문 키 매핑
+const KOREAN_KEY_MAPPING = Object.freeze({
+    "분석 개요": "analysis_overview",
+    "오디언스 상세 분석": "detailed_audience_analysis",
+    "상세 분석": "detailed_analysis",
+    "전략 제안": "strategic_recommendations",
+    "전략적 시사점": "strategic_recommendations",
+    "실행 로드맵": "execution_roadmap",
+    "리스크 & 거버넌스": "risk_governance",
+    "리스크 & 대응": "risk_governance",
+    "부록": "appendix"
+});
+
+// camelCase 키 -> snake_case 키 매핑 (종합 분석 등)
+const CAMEL_CASE_KEY_MAPPING = Object.freeze({
+    "executiveSummary": "executive_summary",
+    "analysisOverview": "analysis_overview",
+    "keyInsights": "key_insights",
+    "keywordAnalysis": "keyword_analysis",
+    "audienceAnalysis": "audience_analysis",
+    "competitiveAnalysis": "competitive_analysis",
+    "strategicRecommendations": "strategic_recommendations",
+    "executionRoadmap": "execution_roadmap",
+    "riskGovernance": "risk_governance",
+    "appendix": "appendix"
+});
+
+// 별칭 키 -> 표준 키 조회 테이블 (mapKeys에서 키마다 한 번씩 조회)
+const KEY_ALIASES = new Map([
+    ...Object.entries(ENGLISH_KEY_MAPPING),
+    ...Object.entries(KOREAN_KEY_MAPPING),
+    ...Object.entries(CAMEL_CASE_KEY_MAPPING)
+]);
+
+// 오디언스 정량 지표 표시 이름
+const AUDIENCE_METRIC_LABELS = new Map([
+    ["estimated_volume", "예상 규모"],
+    ["engagement_level", "참여 수준"],
+    ["growth_potential", "성장 잠재력"],
+    ["market_value", "시장 가치"],
+    ["accessibility", "접근 난이도"]
+]);
+
+// 키워드 분석 / 경쟁 분석 정량 지표 표시 이름 (emitLabeledFields가 이 순서대로 출력)
+const KEYWORD_METRIC_LABELS = new Map([
+    ["estimated_volume", "예상 검색량"],
+    ["competition_level", "경쟁 수준"],
+    ["growth_potential", "성장 잠재력"],
+    ["difficulty_score", "난이도 점수"],
+    ["opportunity_score", "기회 점수"]
+]);
+
+const COMPETITOR_METRIC_LABELS = new Map([
+    ["competition_level", "경쟁 수준"],
+    ["market_opportunity", "시장 기회 크기"],
+    ["differentiation_potential", "차별화 가능성"],
+    ["risk_level", "위험 수준"],
+    ["success_probability", "성공 확률"]
+]);
+
+// 종합 분석의 핵심 오디언스 인사이트 / 제안 방향 필드 표시 이름
+const CORE_DEMO_LABELS = new Map([
+    ["age_range", "연령대"],
+    ["gender", "성별"],
+    ["location", "지역"],
+    ["income_level", "소득 수준"]
+]);
+
+const CORE_BEHAVIOR_LABELS = new Map([
+    ["purchase_behavior", "구매 행동"],
+    ["media_consumption", "미디어 소비"],
+    ["online_activity", "온라인 활동"]
+]);
+
+const MARKETING_STRATEGY_LABELS = new Map([
+    ["keyword_targeting", "키워드 타겟팅"],
+    ["messaging_framework", "메시징 프레임워크"],
+    ["channel_strategy", "채널 전략"]
+]);
+
+const SUCCESS_METRIC_LABELS = new Map([
+    ["keyword_metrics", "키워드 지표"],
+    ["audience_metrics", "오디언스 지표"],
+    ["integrated_kpis", "통합 KPI"]
+]);
+
+// 오디언스 인사이트 필드 표시 이름 (없는 키는 원래 키로 표시)
+const DEMO_LABELS = new Map([
+    ["age_range", "연령대"],
+    ["gender", "성별"],
+    ["location", "지역"],
+    ["income_level", "소득 수준"],
+    ["education_level", "교육 수준"],
+    ["family_status", "가족 구성"],
+    ["expected_occupations", "예상 직업"]
+]);
+
+const PSYCHO_LABELS = new Map([
+    ["lifestyle", "라이프스타일"],
+    ["values", "가치관"],
+    ["interests", "관심사"],
+    ["personality_traits", "성격 특성"],
+    ["aspirations", "열망 및 목표"],
+    ["fears_concerns", "우려사항"]
+]);
+
+const BEHAVIOR_LABELS = new Map([
+    ["purchase_behavior", "구매 행동"],
+    ["media_consumption", "미디어 소비"],
+    ["online_activity", "온라인 활동"],
+    ["brand_loyalty", "브랜드 충성도"],
+    ["decision_making", "의사결정 프로세스"]
+]);
+
+// 보고서 섹션별 별칭 키 목록 (pick에 넘기는 조회 순서, 렌더링마다 새 배열을 만들지 않도록 모듈에서 한 번만 생성)
+const AUDIENCE_FINDINGS_KEYS = ["key_findings", "key_insights", "Key Insights"];
+const AUDIENCE_DETAIL_KEYS = ["detailed_analysis", "detailed_audience_analysis", "Audience Detailed Analysis", "오디언스 상세 분석"];
+const STRATEGIC_RECS_KEYS = ["strategic_recommendations", "Strategic Recommendations", "전략 제안"];
+const SUMMARY_KEYS = ["executive_summary", "Executive Summary", "summary"];
+const FINDINGS_KEYS = ["key_findings", "Key Findings"];
+const KEYWORD_DETAIL_KEYS = ["detailed_analysis", "상세 분석"];
+const KEYWORD_RECS_KEYS = ["strategic_recommendations", "Strategic Recommendations", "전략 제안", "전략적 시사점"];
+const ROADMAP_KEYS = ["execution_roadmap", "Execution Roadmap", "실행 로드맵"];
+const KEYWORD_RISK_KEYS = ["risk_governance", "Risks & Governance", "리스크 & 대응"];
+const KEYWORD_APPENDIX_KEYS = ["appendix", "Appendix", "부록"];
+const INTEGRATED_KEYS = ["integrated_analysis", "detailed_analysis"];
+const RISK_KEYS = ["risk_governance", "Risks & Governance"];
+const APPENDIX_KEYS = ["appendix", "Appendix"];
+// 영문/한글 직접 키 (하나라도 값이 있으면 "분석 결과 없음" 안내를 생략, 대상 유형과 무관)
+const DIRECT_REPORT_KEYS = ["Executive Summary", "Analysis Overview", "Key Insights", "Audience Detailed Analysis", "Strategic Recommendations", "Execution Roadmap", "Risks & Governance", "Appendix", "분석 개요", "오디언스 상세 분석", "전략 제안", "실행 로드맵", "리스크 & 거버넌스", "부록"];
+
+// 보고서에서 제외할 메타데이터/중복 키 (섹션으로 출력하지 않음, 키마다 조회하므로 Set)
+const SKIP_SECTION_KEYS = new Set(["target_keyword", "target_type", "executive_summary", "analysis_overview", "key_findings", "execution_roadmap", "appendix", "Executive Summary", "분석 개요", "Key Findings", "상세 분석", "전략적 시사점", "Strategic Implications", "실행 로드맵", "Execution Roadmap", "리스크 & 대응", "Risks & Responses", "Risks & Governance", "부록", "Appendix", "Detailed Analysis", "primary_insights", "quantitative_metrics", "key_insights", "Key Insights", "detailed_audience_analysis", "Audience Detailed Analysis", "오디언스 상세 분석", "insights", "forward_looking_recommendations", "integrated_analysis", "target_audience", "recommendations", "metrics"]);
+
+// 전략 제안에서 전용 섹션으로 먼저 출력하는 키 (나머지 필드 반복 시 제외)
+const RECS_SPECIAL = new Set(["immediate_actions", "short_term_strategies", "long_term_strategies", "success_metrics"]);
+const COMPREHENSIVE_RECS_SPECIAL = new Set(["content_differentiation", "pricing_strategy", "partnership_opportunities"]);
+
+// 정성적 분석/키워드 추천에서 전용 줄로 먼저 출력하는 키 (기타 필드 반복 시 제외)
+const SENTIMENT_SPECIAL = new Set(["overall_sentiment", "sentiment_score", "positive_aspects", "negative_aspects", "emotional_tone"]);
+const CONTEXT_SPECIAL = new Set(["industry_context", "market_context", "social_context", "cultural_context", "temporal_context", "related_events"]);
+const TONE_SPECIAL = new Set(["overall_tone", "communication_style", "formality_level", "energy_level", "recommended_tone"]);
+const KEYWORD_RECS_SPECIAL = new Set(["semantic_keywords", "co_occurring_keywords", "long_tail_keywords", "trending_keywords"]);
+
+function isObjectRecord(value) {
+    return !!value && typeof value === "object" && !Array.isArray(value);
+}
+
+// 별칭 키 목록 중 처음으로 값이 있는(truthy) 항목 반환 (a || b || c 체인과 동일)
+function pick(obj, keys) {
+    for (let i = 0, n = keys.length; i < n; i++) {
+        const value = obj[keys[i]];
+        if (value) return value;
+    }
+    return undefined;
+}
+
+// 값 종류 태그: 한 번 계산해 두고 분기마다 typeof/Array.isArray를 반복하지 않음
+const KIND_SCALAR = 0;
+const KIND_ARRAY = 1;
+const KIND_OBJECT = 2;
+
+function kindOf(value) {
+    if (Array.isArray(value)) return KIND_ARRAY;
+    return value !== null && typeof value === "object" ? KIND_OBJECT : KIND_SCALAR;
+}
+
+// 응답 구조별 분석 데이터 추출 규칙 (위에서부터 처음 일치하는 규칙 사용)
+const SHAPE_RULES = Object.freeze([
+    // data.data.report가 있으면 그것을 최우선으로 사용 (오디언스 분석 등)
+    { name: "report", match: d => isObjectRecord(d.data) && d.data.report && typeof d.data.report === "object", extract: d => ({ ...d.data.report }) },
+    // data.data를 기본으로 사용 (한글 키도 포함)
+    { name: "data", match: d => isObjectRecord(d.data), extract: d => ({ ...d.data }) },
+    // data가 직접 분석 결과인 경우
+    { name: "direct", match: d => d.executive_summary || d.key_findings || d.detailed_analysis, extract: d => d },
+    // 그 외의 경우
+    { name: "unknown", match: () => true, extract: d => d.data || d || {} }
+]);
+
+// 응답을 보고서 생성용 analysisData로 정규화
+// data.data.analysis가 객체이면 그대로, 문자열이면 코드 블록을 제거하고 JSON 파싱하여 병합 (analysis 필드 내용이 우선)
+function normalizeAnalysisData(data) {
+    const rule = SHAPE_RULES.find(r => r.match(data));
+    let analysisData = rule.extract(data);
+    if (rule.name === "unknown") {
+        console.warn("알 수 없는 데이터 구조:", data);
+    }
+
+    const analysis = isObjectRecord(data.data) ? data.data.analysis : null;
+    if (analysis && typeof analysis === "object") {
+        analysisData = { ...analysisData, ...analysis };
+    } else if (analysis && typeof analysis === "string") {
+        try {
+            analysisData = { ...analysisData, ...JSON.parse(analysis.replace(FENCE_RE, "").trim()) };
+        } catch (parseError) {
+            // 파싱 실패 시 analysis 필드는 무시하고 data.data만 사용
+            console.warn("JSON 파싱 실패, analysis 필드 무시:", parseError);
+        }
+    }
+
+    if (DEBUG) {
+        const keys = Object.keys(analysisData);
+        console.log("analysisData 구조 (" + rule.name + "):", keys, "한글 키:", keys.filter(key => KOREAN_SECTION_KEYS.has(key)));
+    }
+    return analysisData;
+}
+
+// 키 매핑 함수 (한글/영문 키 모두 지원) - 모든 분석 유형에 적용
+// 별칭은 KEY_ALIASES 순서(영문 → 한글 → camelCase)로 확인하므로 같은 표준 키의 별칭이 여럿이면 표에서 앞선 것이 우선
+// 별칭 키가 없으면 복사 없이 원본을 그대로 반환
+function mapKeys(data) {
+    if (!data || typeof data !== "object") return data;
+
+    let mapped = null;
+    for (const [alias, target] of KEY_ALIASES) {
+        const value = data[alias];
+        if (value === undefined || target === alias) continue;
+        // 이미 값이 있는 표준 키는 덮어쓰지 않음
+        if (!(mapped || data)[target]) {
+            mapped = mapped || { ...data };
+            mapped[target] = value;
+        }
+    }
+    return mapped || data;
+}
+
+// Executive Summary 값을 문자열로 정규화
+// text/content 문자열 필드가 있으면 그대로 쓰고, 그 외 객체는 JSON 대신 formatValueForReport 문서 형식으로 변환
+function summaryText(value) {
+    if (value == null || typeof value === "string") return value;
+    if (typeof value === "object") {
+        const text = value.text || value.content;
+        return (text && typeof text === "string") ? text : formatValueForReport(value);
+    }
+    return String(value);
+}
+
+// Executive Summary 섹션을 보고서 조각 배열에 바로 추가
+// API 키 경고 문구와 중복 줄은 제외하고, 남은 줄이 없으면 섹션 자체를 생략
+// (split/join 없이 indexOf로 줄 경계를 찾아 push, 앞뒤 공백은 첫 줄과 마지막 줄에서만 제거)
+// 중복 확인용 Set은 모듈에 하나만 두고 호출이 끝나면 비워서 재사용
+const summarySeenLines = new Set();
+
+function pushSummarySection(parts, summary) {
+    const seen = summarySeenLines;
+    const n = summary.length;
+    let last = -1;
+    try {
+        for (let i = 0; i <= n;) {
+            let end = summary.indexOf("\\n", i);
+            if (end < 0) end = n;
+            const line = summary.slice(i, end);
+            i = end + 2;
+            const trimmed = line.trim();
+            if (!trimmed || WARNING_RE.test(trimmed) || seen.has(trimmed)) continue;
+            seen.add(trimmed);
+            if (last < 0) {
+                parts.push("## Executive Summary\\n\\n", line.trimStart());
+            } else {
+                parts.push("\\n", line);
+            }
+            last = parts.length - 1;
+        }
+    } finally {
+        seen.clear();
+    }
+    if (last >= 0) {
+        parts[last] = parts[last].trimEnd();
+        parts.push("\\n\\n");
+    }
+}
+
+// 객체/배열을 읽기 쉬운 문서 형식으로 변환 (JSON 대신)
+// 재귀 단계마다 줄 배열을 반환하고 가장 바깥에서 한 번만 join
+// (하위 결과를 문자열로 합친 뒤 다시 "\\n"을 찾아 치환하는 과정을 단계마다 반복하지 않음)
+// 객체의 필드를 "- **표시 이름**: 값" 줄로 출력 (표시 이름이 없으면 원래 키, 배열은 쉼표로 연결)
+// 객체가 아니면 값을 그대로 한 줄로 출력
+function emitObjectFields(parts, obj, labels) {
+    if (typeof obj !== "object") {
+        parts.push(obj, "\\n\\n");
+        return;
+    }
+    for (const [key, value] of Object.entries(obj)) {
+        if (!value) continue;
+        parts.push("- **", labels.get(key) || key, "**: ", Array.isArray(value) ? value.join(", ") : value, "\\n");
+    }
+    parts.push("\\n");
+}
+
+// labels에 정의된 필드만 표 순서대로 "- **표시 이름**: 값" 줄로 출력 (값이 없는 필드는 생략)
+function emitLabeledFields(parts, obj, labels) {
+    for (const [key, label] of labels) {
+        const value = obj[key];
+        if (value) parts.push("- **", label, "**: ", value, "\\n");
+    }
+}
+
+// 제목 + emitLabeledFields 필드 줄 + 빈 줄로 이루어진 보고서 섹션 출력
+function pushLabeledSection(parts, header, obj, labels) {
+    parts.push(header);
+    emitLabeledFields(parts, obj, labels);
+    parts.push("\\n");
+}
+
+function formatValueForReport(val, depth) {
+    return formatValueLines(val, depth || 0).join("\\n");
+}
+
+// 보고서 버퍼(parts)를 합치지 않고 from 이후 조각들의 길이 합계 계산
+function partsLength(parts, from) {
+    let length = 0;
+    for (let i = from, n = parts.length; i < n; i++) {
+        length += String(parts[i]).length;
+    }
+    return length;
+}
+
+// 보고서 버퍼(parts)를 합치지 않고 문자열 조각 중 needle을 포함한 것이 있는지 확인
+function partsInclude(parts, needle) {
+    for (let i = 0, n = parts.length; i < n; i++) {
+        const part = parts[i];
+        if (typeof part === "string" && part.includes(needle)) return true;
+    }
+    return false;
+}
+
+// 번호 목록 접두어 "1. " ~ "64. " (항목마다 숫자→문자열 변환과 연결을 반복하지 않도록 미리 생성)
+const ORDINALS = Array.from({ length: 64 }, (_, i) => (i + 1) + ". ");
+
+// 0부터 시작하는 인덱스의 번호 접두어 (표 범위를 넘으면 그때 생성)
+function ordinal(i) {
+    return i < ORDINALS.length ? ORDINALS[i] : (i + 1) + ". ";
+}
+
+// "1. 항목" 형식의 번호 목록과 뒤따르는 빈 줄 출력
+// 배열이 아닌 값(AI가 목록 대신 문자열을 반환한 경우 등)은 글자마다 번호를 붙이지 않고 한 문단으로 출력
+function emitNumberedList(parts, items) {
+    if (!Array.isArray(items)) {
+        appendValueForReport(parts, items);
+        parts.push("\\n\\n");
+        return;
+    }
+    for (let i = 0, n = items.length; i < n; i++) {
+        parts.push(ordinal(i), String(items[i]), "\\n");
+    }
+    parts.push("\\n");
+}
+
+// "- **라벨**:" 줄 아래에 들여쓴 "  1. 항목" 번호 목록 출력 (배열이 아닌 값은 들여쓴 한 줄로 출력)
+function emitIndentedList(parts, items) {
+    if (!Array.isArray(items)) {
+        parts.push("  ", formatValueForReport(items), "\\n");
+        return;
+    }
+    for (let i = 0, n = items.length; i < n; i++) {
+        parts.push("  ", ordinal(i), String(items[i]), "\\n");
+    }
+}
+
+// 항목이 하나 이상 있는 배열인지 확인
+function hasItems(value) {
+    return Array.isArray(value) && value.length > 0;
+}
+
+// 제목과 번호 목록 출력 (배열이 아니거나 비어 있으면 제목도 생략)
+function pushNumberedSection(parts, header, items) {
+    if (!hasItems(items)) return;
+    parts.push(header);
+    emitNumberedList(parts, items);
+}
+
+// formatValueForReport와 같은 내용을 중간 문자열 없이 보고서 버퍼(parts)에 줄 단위로 바로 추가
+function appendValueForReport(parts, val) {
+    const lines = formatValueLines(val, 0);
+    parts.push(lines[0]);
+    for (let i = 1, n = lines.length; i < n; i++) {
+        parts.push("\\n", lines[i]);
+    }
+}
+
+// "### 제목" 헤딩과 formatValueForReport 본문으로 이루어진 보고서 섹션 출력
+function pushValueSection(parts, marker, title, value) {
+    parts.push(marker, " ", title, "\\n\\n");
+    appendValueForReport(parts, value);
+    parts.push("\\n\\n");
+}
+
+// 객체의 각 필드를 "## 제목" 아래 "### 키" 섹션으로 출력
+// 제목은 첫 번째 값(null/undefined 제외)을 만났을 때 출력하므로 빈 객체는 섹션 자체를 생략
+function pushObjectSections(parts, title, obj) {
+    let opened = false;
+    for (const [key, value] of Object.entries(obj)) {
+        if (value == null) continue;
+        if (!opened) {
+            parts.push("## ", title, "\\n\\n");
+            opened = true;
+        }
+        pushValueSection(parts, "###", key, value);
+    }
+}
+
+
+// 인사이트 객체 배열을 "### 인사이트" + 근거/해석/시사점 줄로 출력 (문자열 항목은 번호 목록)
+function pushInsightList(parts, insights) {
+    for (let idx = 0, len = insights.length; idx < len; idx++) {
+        const insight = insights[idx];
+        if (typeof insight === "object") {
+            parts.push("### ", insight.insight || "인사이트 " + (idx + 1), "\\n\\n");
+            if (insight.evidence) parts.push("- **근거**: ", insight.evidence, "\\n");
+            if (insight.interpretation) parts.push("- **해석**: ", insight.interpretation, "\\n");
+            if (insight.implication) parts.push("- **시사점**: ", insight.implication, "\\n");
+            parts.push("\\n");
+        } else {
+            parts.push(ordinal(idx) + insight + "\\n");
+        }
+    }
+    parts.push("\\n");
+}
+
+// Key Findings 배열 항목 출력 (키워드/종합 분석)
+// 객체는 "### 인사이트" + 근거/해석/시사점 줄(영문/한글 키 모두 지원, 값은 formatValueForReport), 그 외 항목은 번호 목록
+function pushFindingItems(parts, items) {
+    for (let idx = 0, len = items.length; idx < len; idx++) {
+        const item = items[idx];
+        if (typeof item === "object" && item !== null) {
+            const evidence = item.evidence || item["근거"];
+            const interpretation = item.interpretation || item["해석"];
+            const implication = item.implication || item["시사점"];
+            const insight = item.insight || item["인사이트"];
+            if (insight) parts.push("### ", insight, "\\n\\n");
+            if (evidence) {
+                parts.push("- **근거**: ");
+                appendValueForReport(parts, evidence);
+                parts.push("\\n");
+            }
+            if (interpretation) {
+                parts.push("- **해석**: ");
+                appendValueForReport(parts, interpretation);
+                parts.push("\\n");
+            }
+            if (implication) {
+                parts.push("- **시사점**: ");
+                appendValueForReport(parts, implication);
+                parts.push("\\n");
+            }
+            parts.push("\\n");
+        } else {
+            parts.push(ordinal(idx) + (item) + "\\n");
+        }
+    }
+}
+
+// 영문/한글 키로 직접 오는 보고서 섹션 (키가 곧 "## 제목", 이 순서대로 출력)
+// skipEmpty: 객체 필드 중 빈 문자열·0 등 falsy 값도 생략
+// indexArrays: 배열 값도 객체처럼 인덱스마다 "### 0" 섹션으로 출력 / list: 배열 값 전용 출력 함수
+const DIRECT_SECTIONS = Object.freeze([
+    { key: "Analysis Overview", skipEmpty: true, indexArrays: true, list: null },
+    { key: "분석 개요", skipEmpty: true, indexArrays: true, list: null },
+    { key: "Key Insights", skipEmpty: false, indexArrays: false, list: pushInsightList },
+    { key: "Audience Detailed Analysis", skipEmpty: true, indexArrays: false, list: null },
+    { key: "오디언스 상세 분석", skipEmpty: true, indexArrays: false, list: null },
+    { key: "Strategic Recommendations", skipEmpty: false, indexArrays: false, list: null },
+    { key: "전략 제안", skipEmpty: false, indexArrays: false, list: null },
+    { key: "Execution Roadmap", skipEmpty: false, indexArrays: false, list: null },
+    { key: "실행 로드맵", skipEmpty: false, indexArrays: false, list: null },
+    { key: "Risks & Governance", skipEmpty: false, indexArrays: false, list: null },
+    { key: "리스크 & 거버넌스", skipEmpty: false, indexArrays: false, list: null },
+    { key: "Appendix", skipEmpty: false, indexArrays: false, list: null },
+    { key: "부록", skipEmpty: false, indexArrays: false, list: null }
+]);
+
+// DIRECT_SECTIONS 항목 하나를 출력: 객체는 필드마다 "### 키" 섹션, 그 외 값은 formatValueForReport 본문
+function pushDirectSection(parts, section, value) {
+    parts.push("## ", section.key, "\\n\\n");
+    if (section.list && Array.isArray(value)) {
+        section.list(parts, value);
+    } else if (isObjectRecord(value) || (section.indexArrays && Array.isArray(value))) {
+        for (const [key, field] of Object.entries(value)) {
+            if (SKIP_SECTION_KEYS.has(key) || field == null || (section.skipEmpty && !field)) continue;
+            pushValueSection(parts, "###", key, field);
+        }
+    } else {
+        appendValueForReport(parts, value);
+        parts.push("\\n\\n");
+    }
+}
+
+// 보고서 텍스트는 "\\n" 문자열로 줄을 구분하므로 값 안의 "\\n"도 줄 경계로 취급
+function splitReportLines(text) {
+    return text.split("\\n");
+}
+
+// 특수 키 이름 한국어 매핑
+const SPECIAL_LABELS = new Map([
+    ["Evidence", "근거"], ["근거", "근거"],
+    ["Interpretation", "해석"], ["해석", "해석"],
+    ["Implication", "시사점"], ["시사점", "시사점"],
+    ["Insight", "인사이트"], ["insight", "인사이트"]
+]);
+
+// 키 -> 표시 이름 캐시 (표시 이름은 키만으로 결정되므로 한 번 계산한 결과를 재사용)
+const LABEL_CACHE = new Map();
+
+function labelize(k) {
+    let label = LABEL_CACHE.get(k);
+    if (label !== undefined) return label;
+    label = SPECIAL_LABELS.get(k);
+    if (label === undefined) {
+        // 숫자_패턴 또는 숫자.패턴 제거 (예: "1_executive_summary" -> "executive_summary", "1. Executive Summary" -> "Executive Summary")
+        // 언더바를 공백으로 변환 및 첫 글자 대문자화
+        label = k.replace(/^\d+[\._]\s?/, '').trim()
+            .split('_').map(word => word.charAt(0).toUpperCase() + word.slice(1)).join(' ');
+    }
+    LABEL_CACHE.set(k, label);
+    return label;
+}
+
+// 항상 한 개 이상의 줄을 반환 (빈 값은 [""])
+function formatValueLines(val, depth) {
+    if (val == null) return [""];
+
+    // 기본 타입 처리
+    if (typeof val === "string") return splitReportLines(val);
+    if (typeof val === "number" || typeof val === "boolean") return [String(val)];
+
+    /* 
+       마크다운 중첩 리스트 규칙:
+       Level 1: - Item
+       Level 2:   - Sub Item (2 spaces)
+       Level 3:     - Sub Sub Item (4 spaces)
+    */
+    // 하위 항목의 둘째 줄부터 2칸 들여쓰기를 붙여 중첩 리스트 구성
+
+    // 배열 처리
+    if (Array.isArray(val)) {
+        if (val.length === 0) return ["(내용 없음)"];
+
+        // 단순 문자열 배열인 경우
+        if (val.every(item => typeof item === "string" || typeof item === "number")) {
+            return splitReportLines(val.join(", "));
+        }
+
+        // 객체나 복잡한 배열인 경우
+        const out = [];
+        for (const item of val) {
+            if (typeof item === "object" && item !== null) {
+                // 객체 항목은 하위 항목으로 표시 (여러 줄이면 둘째 줄부터 들여쓰기)
+                const sub = formatValueLines(item, depth + 1);
+                out.push("- " + sub[0]);
+                for (let i = 1; i < sub.length; i++) {
+                    out.push("  " + sub[i]);
+                }
+            } else {
+                out.push.apply(out, splitReportLines("- " + item));
+            }
+        }
+        return out;
+    }
+
+    // 객체 처리
+    if (typeof val === "object") {
+        const out = [];
+        for (const [k, v] of Object.entries(val)) {
+            if (v == null) continue;
+
+            // 키 이름 포맷팅 (예: "market_size" -> "Market Size")
+            const label = labelize(k);
+
+            // 값 포맷팅 - 재귀 호출
+            const sub = formatValueLines(v, depth + 1);
+
+            // 값이 빈 문자열이면 스킵
+            if (sub.length === 1 && sub[0] === "") continue;
+
+            // 하위 컨텐츠가 멀티라인이거나 리스트인 경우
+            if (sub.length > 1 || sub[0].startsWith("- ")) {
+                out.push("**" + label + "**:"); // 줄바꿈 후 출력
+                out.push.apply(out, sub);
+            } else {
+                out.push("**" + label + "**: " + sub[0]); // 같은 줄 출력
+            }
+        }
+        return out.length ? out : [""];
+    }
+
+    return splitReportLines(String(val));
+}
+
+// 자주 쓰는 DOM 요소를 한 번만 조회하여 재사용 (defer 스크립트이므로 문서 파싱 후 실행됨)
+const EL = Object.freeze({
+    analysisForm: document.getElementById("analysisForm"),
+    targetKeyword: document.getElementById("target_keyword"),
+    targetType: document.getElementById("target_type"),
+    startDate: document.getElementById("start_date"),
+    endDate: document.getElementById("end_date"),
+    additionalContext: document.getElementById("additional_context"),
+    useGemini: document.getElementById("use_gemini"),
+    analyzeBtn: document.getElementById("analyzeBtn"),
+    error: document.getElementById("error"),
+    resultsPanel: document.querySelector(".results-panel"),
+    resultContent: document.getElementById("resultContent"),
+    copyBtn: document.getElementById("copyBtn"),
+    progressBar: document.getElementById("progressBar"),
+    progressPercentage: document.getElementById("progressPercentage"),
+    progressStep: document.getElementById("progressStep")
+});
+
+// 브라우저 확장 프로그램 오류 필터링 (앱 기능에 영향 없음)
+window.addEventListener("unhandledrejection", function(event) {
+    const error = event.reason;
+    const errorMessage = error?.message || error?.toString() || '';
+
+    // 무시해도 되는 오류는 기본 동작 방지
+    if (IGNORED_ERROR_RE.test(errorMessage)) {
+        event.preventDefault();
+        return;
+    }
+});
+
+// 일반 오류 핸들러 (브라우저 확장 프로그램 오류 필터링)
+window.addEventListener("error", function(event) {
+    const errorMessage = event.message || '';
+
+    // 무시해도 되는 오류는 기본 동작 방지
+    if (IGNORED_ERROR_RE.test(errorMessage)) {
+        event.preventDefault();
+        return true;
+    }
+}, true);
+
+// 기본 날짜 설정 (최근 3개월) 및 URL 파라미터 처리
+window.addEventListener("DOMContentLoaded", function() {
+    const today = new Date();
+    const threeMonthsAgo = new Date();
+    threeMonthsAgo.setMonth(today.getMonth() - 3);
+    // 기본 날짜 문자열 (YYYY-MM-DD)은 한 번만 계산
+    const todayIso = today.toISOString().slice(0, 10);
+    const threeMonthsAgoIso = threeMonthsAgo.toISOString().slice(0, 10);
+
+    // 길이 제한 상수
+    const MAX_TARGET_KEYWORD_LENGTH = 200;
+    const MAX_ADDITIONAL_CONTEXT_LENGTH = 2000;
+
+    // 날짜 유효성 검사 헬퍼 함수
+    function isValidDate(dateString) {
+        if (!dateString) return false;
+
+        // YYYY-MM-DD 형식 정규식 검사
+        if (!DATE_RE.test(dateString)) {
+            return false;
+        }
+
+        // Date 객체로 파싱하여 유효성 검사
+        const date = new Date(dateString + "T00:00:00");
+        if (isNaN(date.getTime())) {
+            return false;
+        }
+
+        // 입력된 문자열과 파싱된 날짜가 일치하는지 확인 (예: 2025-13-01 같은 경우 방지)
+        const [year, month, day] = dateString.split("-").map(Number);
+        return date.getFullYear() === year &&
+               date.getMonth() === month - 1 &&
+               date.getDate() === day;
+    }
+
+    // URL 파라미터 읽기
+    const urlParams = new URLSearchParams(window.location.search);
+
+    const targetKeywordInput = EL.targetKeyword;
+    const targetTypeSelect = EL.targetType;
+    const startDateInput = EL.startDate;
+    const endDateInput = EL.endDate;
+    const additionalContextInput = EL.additionalContext;
+    const useGeminiCheckbox = EL.useGemini;
+
+    // URL 파라미터로 폼 채우기 (검증 포함)
+
+    // target_keyword 처리 (길이 제한, URLSearchParams.get은 이미 디코딩된 값을 반환)
+    if (urlParams.has("target_keyword") && targetKeywordInput) {
+        const keywordValue = urlParams.get("target_keyword");
+        if (keywordValue && keywordValue.length <= MAX_TARGET_KEYWORD_LENGTH) {
+            targetKeywordInput.value = keywordValue;
+        }
+    }
+
+    // target_type 처리 (허용된 값 검증)
+    if (urlParams.has("target_type") && targetTypeSelect) {
+        const targetTypeValue = urlParams.get("target_type");
+        // ALLOWED_TYPES가 select 옵션과 동일한 기준 목록
+        if (ALLOWED_TYPES.has(targetTypeValue)) {
+            targetTypeSelect.value = targetTypeValue;
+        }
+    }
+
+    // start_date 처리 (날짜 유효성 검사 + 폴백)
+    if (urlParams.has("start_date") && startDateInput) {
+        const startDateValue = urlParams.get("start_date");
+        if (startDateValue && isValidDate(startDateValue)) {
+            startDateInput.value = startDateValue;
+        } else if (startDateInput) {
+            startDateInput.value = threeMonthsAgoIso;
+        }
+    } else if (startDateInput) {
+        startDateInput.value = threeMonthsAgoIso;
+    }
+
+    // end_date 처리 (날짜 유효성 검사 + 폴백)
+    if (urlParams.has("end_date") && endDateInput) {
+        const endDateValue = urlParams.get("end_date");
+        if (endDateValue && isValidDate(endDateValue)) {
+            endDateInput.value = endDateValue;
+        } else if (endDateInput) {
+            endDateInput.value = todayIso;
+        }
+    } else if (endDateInput) {
+        endDateInput.value = todayIso;
+    }
+
+    // additional_context 처리 (길이 제한, 이미 디코딩된 값 사용)
+    if (urlParams.has("additional_context") && additionalContextInput) {
+        const contextValue = urlParams.get("additional_context");
+        if (contextValue && contextValue.length <= MAX_ADDITIONAL_CONTEXT_LENGTH) {
+            additionalContextInput.value = contextValue;
+        }
+    }
+
+    // use_gemini 처리 (강화된 파싱)
+    if (urlParams.has("use_gemini") && useGeminiCheckbox) {
+        const geminiValue = urlParams.get("use_gemini");
+        if (geminiValue) {
+            const normalizedValue = geminiValue.toLowerCase().trim();
+            useGeminiCheckbox.checked = normalizedValue === "true" || 
+                                        normalizedValue === "1" || 
+                                        normalizedValue === "on";
+        }
+    }
+});
+
+// 보고서 렌더러는 최종 결과 표시에만 필요하므로 별도 모듈로 지연 로드 (초기 파싱 비용 절감)
+let reportRendererPromise = null;
+function loadReportRenderer() {
+    if (!reportRendererPromise) {
+        reportRendererPromise = import("/static/report-render.js").catch(function(err) {
+            reportRendererPromise = null;
+            throw err;
+        });
+    }
+    return reportRendererPromise;
+}
+
+// NDJSON 스트림 리더
+// 디코딩된 텍스트를 이어 붙이며 완성된 줄만 한 번씩 JSON.parse
+// (서버의 json.dumps는 줄바꿈을 이스케이프하므로 한 줄은 항상 완전한 JSON 프레임,
+//  단 NaN 등 잘못된 줄은 경고만 남기고 건너뛰어 분석 전체가 중단되지 않도록 함)
+// 불완전한 꼬리는 보관하되 이미 검사한 위치부터 줄바꿈을 찾으므로 큰 청크도 선형 시간에 처리
+class NdjsonReader {
+    constructor() {
+        this.reset();
+    }
+
+    reset() {
+        this.buffer = "";
+        this.scanFrom = 0;
+    }
+
+    feed(text) {
+        this.buffer += text;
+        const events = [];
+        let start = 0;
+        let newline;
+        while ((newline = this.buffer.indexOf("\n", this.scanFrom)) !== -1) {
+            const line = this.buffer.slice(start, newline);
+            start = this.scanFrom = newline + 1;
+            if (!line.trim()) continue;
+            try {
+                events.push(JSON.parse(line));
+            } catch (parseError) {
+                console.warn("JSON 파싱 실패 (무시):", line.substring(0, 100), parseError);
+            }
+        }
+        if (start) {
+            this.buffer = this.buffer.slice(start);
+        }
+        this.scanFrom = this.buffer.length;
+        return events;
+    }
+
+    // 스트림 종료 시 줄바꿈 없이 남은 마지막 줄 파싱 (없으면 null)
+    flush() {
+        const rest = this.buffer.trim();
+        this.reset();
+        return rest ? JSON.parse(rest) : null;
+    }
+}
+
+// 복사용 결과 텍스트 (DOM에 쓰는 내용과 함께 누적, innerText 읽기로 인한 강제 레이아웃 방지)
+let resultCopyText = "";
+
+// 클립보드 복사 함수
+function copyToClipboard() {
+    const text = resultCopyText || EL.resultContent.textContent || "";
+
+    navigator.clipboard.writeText(text).then(function() {
+        const copyBtn = EL.copyBtn;
+        const originalText = copyBtn.textContent;
+        copyBtn.textContent = "복사됨!";
+        copyBtn.style.background = "#333333";
+
+        setTimeout(function() {
+            copyBtn.textContent = originalText;
+            copyBtn.style.background = "black";
+        }, 2000);
+    }).catch(function(err) {
+        console.error("복사 실패:", err);
+        alert("복사에 실패했습니다. 수동으로 선택하여 복사해주세요.");
+    });
+}
+
+// 결과 패널 버튼은 data-action 기준으로 하나의 위임 리스너에서 처리
+const RESULT_ACTIONS = Object.freeze({
+    copy: copyToClipboard
+});
+
+EL.resultsPanel.addEventListener("click", function(e) {
+    const target = e.target.closest("[data-action]");
+    const handler = target && RESULT_ACTIONS[target.dataset.action];
+    if (handler) {
+        handler(e);
+    }
+});
+
+EL.analysisForm.addEventListener("submit", async function(e) {
+    e.preventDefault();
+
+    const form = e.target;
+    const { error, resultContent, analyzeBtn } = EL;
+
+    // 결과 패널 상태 전환 (empty | loading | streaming | result | error)
+    // 각 영역의 표시 여부는 CSS가 data-state 하나로 결정하므로 상태 전환당 속성 변경은 한 번뿐
+    function setPanelState(state) {
+        EL.resultsPanel.dataset.state = state;
+    }
+
+    // 초기화
+    setPanelState("loading");
+    analyzeBtn.disabled = true;
+
+    // 스트리밍이 진행되는 동안 보고서 렌더러를 미리 로드 (실패 시 결과 표시 시점에 재시도)
+    loadReportRenderer().catch(function() {});
+
+    // 진행률 표시 초기화 및 표시
+    const { progressBar, progressPercentage, progressStep } = EL;
+
+    // 진행률 DOM 갱신: 마지막으로 쓴 값과 같으면 건너뛰어 불필요한 스타일 재계산 방지
+    let lastPct = null;
+    let lastStep = null;
+    let rafId = null;
+
+    function setText(el, text) {
+        if (el.firstChild && el.firstChild.nodeType === Node.TEXT_NODE) {
+            el.firstChild.nodeValue = text;
+        } else {
+            el.textContent = text;
+        }
+    }
+
+    function paint(pct, step) {
+        if (pct !== lastPct) {
+            if (progressBar) {
+                progressBar.style.width = pct + "%";
+                setText(progressBar, pct + "%");
+            }
+            if (progressPercentage) {
+                setText(progressPercentage, pct + "%");
+            }
+            lastPct = pct;
+        }
+        if (step !== lastStep) {
+            if (progressStep) {
+                setText(progressStep, step);
+            }
+            lastStep = step;
+        }
+    }
+
+    // 예상 진행률 애니메이션 중지 (서버 진행률 수신 또는 종료 시)
+    function stopProgressTicker() {
+        if (rafId !== null) {
+            cancelAnimationFrame(rafId);
+            rafId = null;
+        }
+    }
+
+    // 서버 진행률은 프레임당 한 번만 반영 (가장 최근 값만 유지)
+    let pendingProgress = null;
+    let progressRafId = null;
+
+    function flushProgress() {
+        progressRafId = null;
+        if (pendingProgress) {
+            paint(pendingProgress.pct, pendingProgress.step);
+            pendingProgress = null;
+        }
+    }
+
+    function scheduleProgress(pct, step) {
+        pendingProgress = { pct: pct, step: step };
+        if (progressRafId === null) {
+            progressRafId = requestAnimationFrame(flushProgress);
+        }
+    }
+
+    // 진행률 갱신 예약을 모두 취소 (완료 표시가 이후 프레임에서 덮어써지지 않도록)
+    function stopProgressUpdates() {
+        stopProgressTicker();
+        if (progressRafId !== null) {
+            cancelAnimationFrame(progressRafId);
+            progressRafId = null;
+        }
+        pendingProgress = null;
+    }
+
+    paint(0, "분석 준비 중...");
+
+    // 폼 데이터 수집
+    const startDate = EL.startDate.value;
+    const endDate = EL.endDate.value;
+
+    // 날짜 유효성 검사
+    if (!startDate || !endDate) {
+        error.textContent = "시작일과 종료일을 모두 입력해주세요.";
+        setPanelState("error");
+        analyzeBtn.disabled = false;
+        return;
+    }
+
+    if (new Date(startDate) > new Date(endDate)) {
+        error.textContent = "시작일은 종료일보다 이전이어야 합니다.";
+        setPanelState("error");
+        analyzeBtn.disabled = false;
+        return;
+    }
+
+    const formData = {
+        target_keyword: EL.targetKeyword.value,
+        target_type: EL.targetType.value,
+        additional_context: EL.additionalContext.value || null,
+        use_gemini: EL.useGemini.checked,
+        start_date: startDate,
+        end_date: endDate,
+        include_sentiment: true,
+        include_recommendations: true
+    };
+
+    try {
+        const providerStep = formData.use_gemini ? "Gemini API 호출 중..." : "OpenAI API 호출 중...";
+
+        const STEP_INTERVAL_MS = 2000; // 2초마다 다음 단계로
+        let currentStepIndex = 0;
+        let lastStepAt = performance.now();
+
+        // 진행률 애니메이션 (requestAnimationFrame, 서버 진행률이 오면 중지)
+        function tick(now) {
+            if (now - lastStepAt >= STEP_INTERVAL_MS) {
+                lastStepAt = now;
+                const currentStep = ANALYSIS_STEPS[currentStepIndex];
+                paint(currentStep.progress, currentStep.step || providerStep);
+                currentStepIndex++;
+            }
+            rafId = currentStepIndex < ANALYSIS_STEPS.length - 1 ? requestAnimationFrame(tick) : null;
+        }
+        rafId = requestAnimationFrame(tick);
+
+        // API URL 설정 (스트리밍 엔드포인트 사용)
+        const apiBaseUrl = window.location.origin;
+        const apiUrl = apiBaseUrl + "/api/target/analyze/stream";
+
+        console.log("API 스트리밍 호출:", apiUrl, formData);
+
+        // 결과 컨텐츠 초기화 및 표시 (진행률과 함께 스트리밍 결과 표시)
+        resultContent.innerHTML = "";
+        resultCopyText = "";
+        setPanelState("streaming");
+
+        let accumulatedResult = null;
+
+        // 섹션별 스트리밍 출력 영역 (section -> { node, texts })
+        // 섹션이 번갈아 도착해도 문장은 해당 섹션의 영역에 이어 붙음
+        const streamSections = new Map();
+        let currentSink = null;
+
+        // 스트리밍 문장 버퍼 (프레임당 최대 1회만 DOM에 추가하여 리플로우 감소)
+        let pendingText = "";
+        let flushScheduled = false;
+
+        function flushPendingText() {
+            if (pendingText) {
+                currentSink.node.appendChild(document.createTextNode(pendingText));
+                pendingText = "";
+            }
+        }
+
+        // 섹션 영역 조회/생성 (앞선 문장을 먼저 반영한 뒤 전환)
+        // 첫 영역이 executive_summary이면 헤더 없이 시작 (보고서 첫머리)
+        function selectSink(section) {
+            if (currentSink && currentSink.section === section) return;
+            flushPendingText();
+            let sink = streamSections.get(section);
+            if (!sink) {
+                const node = document.createElement("div");
+                node.className = "stream-section";
+                node.dataset.section = section;
+                const header = streamSections.size === 0 && section === "executive_summary" ? "" : (SECTION_HEADERS[section] || "");
+                if (header) {
+                    node.appendChild(document.createTextNode(header));
+                }
+                resultContent.appendChild(node);
+                sink = { section: section, node: node, texts: header ? [header] : [] };
+                streamSections.set(section, sink);
+            }
+            currentSink = sink;
+        }
+
+        // 스트리밍으로 표시된 텍스트 (섹션 순서대로, 스트림 종료 시 한 번만 join)
+        function streamedText() {
+            const texts = [];
+            for (const sink of streamSections.values()) {
+                texts.push(sink.texts.join(""));
+            }
+            return texts.join("");
+        }
+
+        function scheduleFlush() {
+            if (flushScheduled) return;
+            flushScheduled = true;
+            requestAnimationFrame(() => {
+                flushScheduled = false;
+                flushPendingText();
+                // 스크롤을 맨 아래로 (쓰기 이후 프레임당 한 번만 레이아웃 읽기)
+                resultContent.scrollTop = resultContent.scrollHeight;
+            });
+        }
+
+        function appendSentence(section, text) {
+            selectSink(section);
+            pendingText += text + " ";
+            currentSink.texts.push(text, " ");
+            scheduleFlush();
+        }
+
+        const response = await fetch(apiUrl, {
+            method: "POST",
+            headers: {
+                "Content-Type": "application/json",
+            },
+            body: JSON.stringify(formData)
+        });
+
+        console.log("API 스트리밍 응답 상태:", response.status, response.statusText);
+
+        if (!response.ok) {
+            let errorData = {};
+            try {
+                errorData = await response.json();
+            } catch (e) {
+                try {
+                    errorData = { detail: await response.text() || "분석 요청 실패" };
+                } catch (textError) {
+                    errorData = { detail: `HTTP ${response.status}: ${response.statusText}` };
+                }
+            }
+            console.error("API 오류:", errorData);
+            const errorMessage = errorData.detail || errorData.error || errorData.message || `HTTP ${response.status}: 분석 요청 실패`;
+            throw new Error(errorMessage);
+        }
+
+        // 스트리밍 응답 읽기 (응답 본문 확인)
+        if (!response.body) {
+            throw new Error("스트리밍 응답 본문을 읽을 수 없습니다.");
+        }
+
+        // UTF-8 디코딩은 스트림 파이프라인에서 처리 (청크 경계에서 잘린 멀티바이트 문자도 이어서 디코딩)
+        // 읽기 취소는 파이프를 따라 응답 본문까지 전달됨
+        const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+        const ndjson = new NdjsonReader();
+        let hasReceivedData = false;
+        let streamError = null;
+
+        // 스트리밍 청크 처리 (완료 청크이면 true 반환)
+        function handleStreamEvent(chunk) {
+            if (DEBUG) console.log("스트리밍 청크:", chunk);
+
+            // 문장 타입 처리
+            if (chunk.type === "sentence") {
+                // 문장 추가 (실시간 표시, 섹션별 영역)
+                appendSentence(chunk.section || "executive_summary", chunk.content);
+            }
+            // 진행 상황 처리
+            else if (chunk.type === "progress") {
+                stopProgressTicker();
+                scheduleProgress(chunk.progress, chunk.message || "분석 중...");
+            }
+            // 완료 처리
+            else if (chunk.type === "complete") {
+                accumulatedResult = chunk.data;
+
+                // 예약된 진행률 갱신만 취소 (100% 표시는 아래 최종 진행률 업데이트에서 한 번에 기록)
+                stopProgressUpdates();
+
+                // 최종 결과가 있으면 추가 정보 표시
+                if (chunk.data) {
+                    console.log("최종 결과 수신:", chunk.data);
+                }
+
+                return true;
+            }
+            // 오류 처리
+            else if (chunk.type === "error") {
+                streamError = new Error(chunk.message || "알 수 없는 오류가 발생했습니다.");
+                throw streamError;
+            }
+            return false;
+        }
+
+        try {
+            while (true) {
+                const { done, value } = await reader.read();
+
+                if (done) {
+                    console.log("스트리밍 완료");
+                    break;
+                }
+
+                hasReceivedData = true;
+
+                // 완성된 줄만 파싱하여 처리
+                let finished = false;
+                for (const chunk of ndjson.feed(value)) {
+                    if (handleStreamEvent(chunk)) {
+                        finished = true;
+                        break;
+                    }
+                }
+
+                // 완료 청크를 받으면 남은 스트림을 읽지 않고 즉시 해제
+                if (finished) {
+                    ndjson.reset();
+                    await reader.cancel();
+                    break;
+                }
+            }
+        } catch (streamReadError) {
+            console.error("스트리밍 읽기 오류:", streamReadError);
+            if (!streamError) {
+                streamError = streamReadError;
+            }
+            // 오류 청크 또는 읽기 오류 시에도 스트림 해제 (이미 닫힌 경우 무시)
+            reader.cancel().catch(function() {});
+        }
+
+        // 스트리밍 중 오류가 발생했거나 데이터를 받지 못한 경우
+        if (streamError) {
+            throw streamError;
+        }
+
+        if (!hasReceivedData) {
+            throw new Error("서버로부터 데이터를 받지 못했습니다. API 서버 상태를 확인해주세요.");
+        }
+
+        // 버퍼에 남은 데이터 처리 (줄바꿈 없이 끝난 마지막 줄, 불완전하면 경고만)
+        try {
+            const chunk = ndjson.flush();
+            if (chunk && (chunk.type === "sentence" || chunk.type === "complete")) {
+                handleStreamEvent(chunk);
+            }
+        } catch (parseError) {
+            console.warn("버퍼 파싱 실패:", parseError);
+        }
+
+        // 아직 반영되지 않은 문장을 즉시 추가
+        flushPendingText();
+        resultCopyText = streamedText();
+
+        // 기존 코드와의 호환성을 위해 data 변수 설정
+            let data = null;
+
+        if (accumulatedResult) {
+            data = {
+                success: true,
+                data: accumulatedResult
+            };
+            console.log("최종 분석 결과 수신:", Object.keys(accumulatedResult));
+        } else {
+            // accumulatedResult가 없지만 스트리밍으로 표시된 텍스트가 있는 경우
+            // (DOM의 텍스트 노드를 다시 읽지 않고 섹션별로 함께 누적한 사본 사용)
+            const displayedText = resultCopyText;
+            if (displayedText.trim().length > 0) {
+                // 표시된 텍스트가 있으면 최소한의 결과 구조 생성
+                data = {
+                    success: true,
+                    data: {
+                        executive_summary: displayedText,
+                        target_keyword: formData.target_keyword,
+                        target_type: formData.target_type,
+                        note: "스트리밍 결과가 완전히 수신되지 않았지만 일부 내용은 표시되었습니다."
+                    }
+                };
+                console.log("부분 결과 사용 (텍스트만 수신)");
+            } else {
+                // 아무것도 받지 못한 경우
+                data = {
+                    success: false,
+                    error: "분석 결과를 받지 못했습니다. 서버 로그를 확인하거나 잠시 후 다시 시도해주세요."
+                };
+                console.error("분석 결과 없음 - accumulatedResult와 displayedText 모두 비어있음");
+            }
+        }
+
+        console.log("최종 분석 결과:", data);
+
+        // 최종 진행률 업데이트 (진행률 정보가 있으면 해당 단계 표시)
+        stopProgressUpdates();
+        const progressInfo = data.data && data.data.progress_info;
+        paint(100, (progressInfo && progressInfo.current_step) || "분석 완료");
+
+        if (data && data.success && data.data) {
+            // 결과를 Markdown 형식으로 포맷팅
+            // 보고서 Markdown 조각 (문자열 += 대신 배열에 모아 마지막에 한 번만 join)
+            const parts = [];
+
+            // 디버깅: 받은 데이터 로깅
+            if (DEBUG) {
+                console.log("API 응답 받음:", {
+                    success: data.success,
+                    dataType: typeof data.data,
+                    dataKeys: Object.keys(data.data)
+                });
+            }
+
+            // JSON 데이터 파싱 - 여러 구조 지원 (SHAPE_RULES 순서대로 판별 후 analysis 필드 병합)
+            let analysisData = normalizeAnalysisData(data);
+
+            if (DEBUG) {
+                const summary = analysisData?.executive_summary;
+                console.log("analysisData 상세 (일부):", JSON.stringify({
+                    executive_summary: typeof summary === "string" ? summary.substring(0, 100) : summary,
+                    has_key_findings: !!analysisData?.key_findings,
+                    has_detailed_analysis: !!analysisData?.detailed_analysis,
+                    has_sentiment: !!analysisData?.sentiment,
+                    has_context: !!analysisData?.context,
+                    has_tone: !!analysisData?.tone,
+                    has_recommendations: !!analysisData?.recommendations
+                }));
+            }
+
+            // Markdown 형식으로 변환
+            const targetKeyword = formData.target_keyword;
+            const targetType = formData.target_type;
+
+            const typeName = TYPE_NAMES[targetType] || targetType;
+
+            parts.push(
+                "# 타겟 분석 보고서\\n\\n",
+                "**분석 대상**: " + targetKeyword + "\\n",
+                "**분석 유형**: " + typeName + " 분석\\n",
+                "**분석 기간**: " + formData.start_date + " ~ " + formData.end_date + "\\n",
+                "**분석 일시**: " + REPORT_DATE_FORMAT.format(new Date()) + "\\n\\n",
+                "---\\n\\n"
+            );
+            const baseCount = parts.length;
+
+            // 모든 분석 유형에 키 매핑 적용 (키워드/오디언스/종합 공통)
+            analysisData = mapKeys(analysisData || {});
+
+            // 오디언스 분석인 경우 특별한 포맷팅 (MECE 구조 지원)
+            if (targetType === "audience" && analysisData) {
+
+                // Executive Summary (중복 제거) - 영문/한글 키 모두 지원
+                let executiveSummary = null;
+                if (analysisData.executive_summary) {
+                    executiveSummary = analysisData.executive_summary;
+                } else if (analysisData.summary) {
+                    executiveSummary = analysisData.summary;
+                } else if (analysisData["Executive Summary"]) {
+                    executiveSummary = analysisData["Executive Summary"];
+                }
+
+                // 객체인 경우 문자열로 변환 (줄 단위 처리 전 필수)
+                executiveSummary = summaryText(executiveSummary);
+
+                // 중복된 내용 제거 (API 키 경고 메시지 등)
+                if (executiveSummary && typeof executiveSummary === "string") {
+                    pushSummarySection(parts, executiveSummary);
+                }
+
+                // Key Findings 또는 Key Insights 처리 (영문/한글 키 모두 지원)
+                const keyFindings = pick(analysisData, AUDIENCE_FINDINGS_KEYS);
+                const keyFindingsKind = kindOf(keyFindings);
+                if (keyFindings) {
+                    parts.push("## 주요 발견사항 (Key Findings)\\n\\n");
+
+                    // Key Insights가 배열인 경우 직접 처리
+                    if (keyFindingsKind === KIND_ARRAY) {
+                        pushInsightList(parts, keyFindings);
+                    } else if (keyFindingsKind === KIND_OBJECT) {
+                        // primary_insights가 배열인 경우
+                    if (hasItems(keyFindings.primary_insights)) {
+                        parts.push("### 핵심 인사이트\\n\\n");
+                        for (let idx = 0, len = keyFindings.primary_insights.length; idx < len; idx++) {
+                            const point = keyFindings.primary_insights[idx];
+                            // API 키 경고 메시지 제거
+                            if (!WARNING_RE.test(point)) {
+                                parts.push(ordinal(idx) + point + "\\n");
+                            }
+                        }
+                        parts.push("\\n");
+                    }
+                    // primary_insights가 문자열인 경우
+                    else if (keyFindings.primary_insights && typeof keyFindings.primary_insights === "string") {
+                        parts.push("### 핵심 인사이트\\n\\n", keyFindings.primary_insights, "\\n\\n");
+                    }
+
+                    // quantitative_metrics
+                    if (keyFindings.quantitative_metrics && typeof keyFindings.quantitative_metrics === "object") {
+                        parts.push("### 정량적 지표\\n\\n");
+                        const metrics = keyFindings.quantitative_metrics;
+                        // 모든 메트릭 필드를 동적으로 표시
+                        for (const [key, value] of Object.entries(metrics)) {
+                            if (value && !value.toString().includes('AI API 필요')) {
+                                const label = AUDIENCE_METRIC_LABELS.get(key) || key;
+                                parts.push("- **", label, "**: ", value, "\\n");
+                            }
+                        }
+                        parts.push("\\n");
+                    }
+
+                    // keyFindings의 다른 필드들도 표시 (SKIP_SECTION_KEYS 제외, 객체는 formatValueForReport)
+                    for (const [key, value] of Object.entries(keyFindings)) {
+                        if (SKIP_SECTION_KEYS.has(key) || !value) continue;
+                        parts.push("### ", key, "\\n\\n");
+                        switch (kindOf(value)) {
+                            case KIND_ARRAY:
+                                for (let idx = 0, len = value.length; idx < len; idx++) {
+                                    const item = value[idx];
+                                    parts.push(ordinal(idx) + (kindOf(item) === KIND_SCALAR ? item : formatValueForReport(item)) + "\\n");
+                                }
+                                break;
+                            case KIND_OBJECT:
+                                appendValueForReport(parts, value);
+                                parts.push("\\n");
+                                break;
+                            default:
+                                parts.push((value) + "\\n");
+                        }
+                        parts.push("\\n");
+                    }
+                    }
+                } else if (hasItems(analysisData.key_points)) {
+                    parts.push("## 주요 포인트\\n\\n");
+                    for (let idx = 0, len = analysisData.key_points.length; idx < len; idx++) {
+                        const point = analysisData.key_points[idx];
+                        // API 키 경고 메시지 제거
+                        if (!WARNING_RE.test(point)) {
+                            parts.push(ordinal(idx) + point + "\\n");
+                        }
+                    }
+                    parts.push("\\n");
+                }
+
+                // Detailed Analysis (영문/한글 키 모두 지원)
+                const detailedAnalysis = pick(analysisData, AUDIENCE_DETAIL_KEYS);
+                const insights = detailedAnalysis?.insights || analysisData.insights;
+
+                // detailed_analysis 객체 또는 직접 insights 객체가 있는 경우
+                if ((detailedAnalysis && typeof detailedAnalysis === "object") || (insights && typeof insights === "object")) {
+                    parts.push("## 상세 분석 (Detailed Analysis)\\n\\n");
+
+                    // insights가 있는 경우
+                    if (insights) {
+                        if (insights.demographics) {
+                            parts.push("### 인구통계학적 특성\\n\\n");
+                            emitObjectFields(parts, insights.demographics, DEMO_LABELS);
+                        }
+
+                        if (insights.psychographics) {
+                            parts.push("### 심리적 특성\\n\\n");
+                            emitObjectFields(parts, insights.psychographics, PSYCHO_LABELS);
+                        }
+
+                        if (insights.behavior) {
+                            parts.push("### 행동 패턴\\n\\n");
+                            emitObjectFields(parts, insights.behavior, BEHAVIOR_LABELS);
+                        }
+
+                        pushNumberedSection(parts, "### 트렌드\\n\\n", insights.trends);
+                        pushNumberedSection(parts, "### 기회\\n\\n", insights.opportunities);
+                        pushNumberedSection(parts, "### 도전 과제\\n\\n", insights.challenges);
+                    }
+                    // detailed_analysis가 객체이지만 insights가 없는 경우 (SKIP_SECTION_KEYS, formatValueForReport)
+                    else {
+                        for (const [key, value] of Object.entries(detailedAnalysis)) {
+                            if (SKIP_SECTION_KEYS.has(key) || !value) continue;
+                            pushValueSection(parts, "###", key, value);
+                        }
+                    }
+                }
+
+                // Strategic Recommendations (영문/한글 키 모두 지원)
+                const strategicRecs = pick(analysisData, STRATEGIC_RECS_KEYS);
+                if (strategicRecs) {
+                    parts.push("## 전략적 권장사항 (Strategic Recommendations)\\n\\n");
+
+                    const recs = strategicRecs;
+
+                    if (recs.immediate_actions && recs.immediate_actions.length > 0) {
+                        parts.push("### 즉시 실행 가능한 전략\\n\\n");
+                        emitNumberedList(parts, recs.immediate_actions);
+                    }
+
+                    if (recs.short_term_strategies && recs.short_term_strategies.length > 0) {
+                        parts.push("### 단기 전략 (3-6개월)\\n\\n");
+                        emitNumberedList(parts, recs.short_term_strategies);
+                    }
+
+                    if (recs.long_term_strategies && recs.long_term_strategies.length > 0) {
+                        parts.push("### 장기 전략 (6개월 이상)\\n\\n");
+                        emitNumberedList(parts, recs.long_term_strategies);
+                    }
+
+                    if (recs.success_metrics) {
+                        parts.push("### 성공 지표\\n\\n", recs.success_metrics, "\\n\\n");
+                    }
+                    // 나머지 필드 (전용 섹션 키와 SKIP_SECTION_KEYS 제외)
+                    if (kindOf(recs) === KIND_OBJECT) {
+                        for (const [k, v] of Object.entries(recs)) {
+                            if (RECS_SPECIAL.has(k) || SKIP_SECTION_KEYS.has(k)) continue;
+                            if (v == null) continue;
+                            pushValueSection(parts, "###", k, v);
+                        }
+                    }
+                } else if (analysisData.recommendations && analysisData.recommendations.length > 0) {
+                    parts.push("## 권장사항\\n\\n");
+                    emitNumberedList(parts, analysisData.recommendations);
+                }
+
+                // Metrics (하위 호환성)
+                if (analysisData.metrics && !analysisData.key_findings) {
+                    pushLabeledSection(parts, "## 지표\\n\\n", analysisData.metrics, AUDIENCE_METRIC_LABELS);
+                }
+            } else if (targetType === "keyword" && analysisData) {
+                // 키워드 분석 상세 포맷팅 (MECE 구조 지원)
+
+                // Executive Summary (문자열이 아닌 경우 변환)
+                let execSummary = pick(analysisData, SUMMARY_KEYS);
+                execSummary = summaryText(execSummary);
+                if (execSummary && typeof execSummary === "string") {
+                    parts.push("## Executive Summary\\n\\n", execSummary, "\\n\\n");
+                }
+
+                // Key Findings (배열 또는 객체 모두 지원)
+                const keyFindingsKw = pick(analysisData, FINDINGS_KEYS);
+                if (keyFindingsKw) {
+                    parts.push("## 주요 발견사항 (Key Findings)\\n\\n");
+
+                    if (Array.isArray(keyFindingsKw) && keyFindingsKw.length > 0) {
+                        pushFindingItems(parts, keyFindingsKw);
+                    } else {
+                        pushNumberedSection(parts, "### 핵심 인사이트\\n\\n", keyFindingsKw.primary_insights);
+                    }
+
+                    if (keyFindingsKw.quantitative_metrics && typeof keyFindingsKw.quantitative_metrics === "object") {
+                        pushLabeledSection(parts, "### 정량적 지표\\n\\n", keyFindingsKw.quantitative_metrics, KEYWORD_METRIC_LABELS);
+                    }
+                } else if (hasItems(analysisData.key_points)) {
+                    parts.push("## 주요 포인트\\n\\n");
+                    emitNumberedList(parts, analysisData.key_points);
+                }
+
+                // Detailed Analysis (상세 분석 객체 또는 insights)
+                const detailedAnalysisKw = pick(analysisData, KEYWORD_DETAIL_KEYS) || analysisData;
+                const insights = detailedAnalysisKw.insights || analysisData.insights;
+
+                if (insights) {
+                    parts.push("## 상세 분석 (Detailed Analysis)\\n\\n");
+
+                    if (insights.search_intent) {
+                        parts.push("### 검색 의도 분석\\n\\n");
+                        const intent = insights.search_intent;
+                        if (intent.primary_intent) parts.push("- **주요 검색 의도**: ", intent.primary_intent, "\\n");
+                        if (intent.intent_breakdown) parts.push("- **의도별 분포**: ", intent.intent_breakdown, "\\n");
+                        if (intent.user_journey_stage) parts.push("- **사용자 여정 단계**: ", intent.user_journey_stage, "\\n");
+                        if (intent.search_context) parts.push("- **검색 맥락**: ", intent.search_context, "\\n");
+                        parts.push("\\n");
+                    }
+
+                    if (insights.competition) {
+                        parts.push("### 경쟁 환경\\n\\n");
+                        const comp = insights.competition;
+                        if (comp.competition_level) parts.push("- **경쟁 수준**: ", comp.competition_level, "\\n");
+                        if (comp.top_competitors && comp.top_competitors.length > 0) {
+                            parts.push("- **주요 경쟁 페이지**:\\n");
+                            emitIndentedList(parts, comp.top_competitors);
+                        }
+                        if (comp.competitor_analysis) parts.push("- **경쟁자 분석**: ", comp.competitor_analysis, "\\n");
+                        if (comp.market_gap) parts.push("- **시장 공백**: ", comp.market_gap, "\\n");
+                        parts.push("\\n");
+                    }
+
+                    if (insights.trends) {
+                        parts.push("### 검색 트렌드\\n\\n");
+                        const trends = insights.trends;
+                        if (trends.search_volume_trend) parts.push("- **검색량 트렌드**: ", trends.search_volume_trend, "\\n");
+                        if (trends.seasonal_patterns) parts.push("- **계절성 패턴**: ", trends.seasonal_patterns, "\\n");
+                        if (hasItems(trends.trending_topics)) {
+                            parts.push("- **관련 트렌딩 토픽**:\\n");
+                            emitIndentedList(parts, trends.trending_topics);
+                        }
+                        if (trends.period_analysis) parts.push("- **기간별 분석**: ", trends.period_analysis, "\\n");
+                        if (trends.future_outlook) parts.push("- **향후 전망**: ", trends.future_outlook, "\\n");
+                        parts.push("\\n");
+                    }
+
+                    if (insights.related_keywords) {
+                        parts.push("### 관련 키워드\\n\\n");
+                        const related = insights.related_keywords;
+                        pushNumberedSection(parts, "#### 의미적 관련 키워드\\n\\n", related.semantic_keywords);
+                        pushNumberedSection(parts, "#### 롱테일 키워드\\n\\n", related.long_tail_keywords);
+                        pushNumberedSection(parts, "#### 질문형 키워드\\n\\n", related.question_keywords);
+                        pushNumberedSection(parts, "#### 비교형 키워드\\n\\n", related.comparison_keywords);
+                    }
+
+                    pushNumberedSection(parts, "### SEO 기회\\n\\n", insights.opportunities);
+                    pushNumberedSection(parts, "### SEO 도전 과제\\n\\n", insights.challenges);
+                } else if (isObjectRecord(detailedAnalysisKw)) {
+                    parts.push("## 상세 분석 (Detailed Analysis)\\n\\n");
+                    for (const [key, val] of Object.entries(detailedAnalysisKw)) {
+                        if (key === "insights") continue;
+                        if (SKIP_SECTION_KEYS.has(key)) continue;
+                        if (val == null) continue;
+                        pushValueSection(parts, "###", key, val);
+                    }
+                }
+
+                // Strategic Recommendations (영문/한글 키 모두 지원)
+                const strategicRecsKw = pick(analysisData, KEYWORD_RECS_KEYS);
+                if (strategicRecsKw) {
+                    parts.push("## 전략적 권장사항 (Strategic Recommendations)\\n\\n");
+
+                    const recsKw = strategicRecsKw;
+
+                    if (recsKw.immediate_actions && recsKw.immediate_actions.length > 0) {
+                        parts.push("### 즉시 실행 가능한 전략\\n\\n");
+                        emitNumberedList(parts, recsKw.immediate_actions);
+                    }
+
+                    if (recsKw.short_term_strategies && recsKw.short_term_strategies.length > 0) {
+                        parts.push("### 단기 전략 (3-6개월)\\n\\n");
+                        emitNumberedList(parts, recsKw.short_term_strategies);
+                    }
+
+                    if (recsKw.long_term_strategies && recsKw.long_term_strategies.length > 0) {
+                        parts.push("### 장기 전략 (6개월 이상)\\n\\n");
+                        emitNumberedList(parts, recsKw.long_term_strategies);
+                    }
+
+                    if (recsKw.success_metrics) {
+                        parts.push("### 성공 지표\\n\\n", recsKw.success_metrics, "\\n\\n");
+                    }
+
+                    if (kindOf(recsKw) === KIND_OBJECT && !recsKw.immediate_actions && !recsKw.short_term_strategies && !recsKw.long_term_strategies && !recsKw.success_metrics) {
+                        for (const [k, v] of Object.entries(recsKw)) {
+                            if (SKIP_SECTION_KEYS.has(k)) continue;
+                            if (v == null) continue;
+                            pushValueSection(parts, "###", k, v);
+                        }
+                    }
+                } else if (analysisData.recommendations && analysisData.recommendations.length > 0) {
+                    parts.push("## 키워드 최적화 전략\\n\\n");
+                    emitNumberedList(parts, analysisData.recommendations);
+                }
+
+                // Metrics (하위 호환성)
+                if (analysisData.metrics && !analysisData.key_findings) {
+                    pushLabeledSection(parts, "## 지표\\n\\n", analysisData.metrics, KEYWORD_METRIC_LABELS);
+                }
+
+                // 타겟 오디언스 정보 (키워드 분석의 경우)
+                if (analysisData.target_audience && analysisData.target_audience.expected_occupations) {
+                    parts.push("## 예상 직업\\n\\n");
+                    emitNumberedList(parts, analysisData.target_audience.expected_occupations);
+                }
+
+                // 실행 로드맵 (키워드 분석)
+                const roadmapKw = pick(analysisData, ROADMAP_KEYS);
+                if (roadmapKw && typeof roadmapKw === "object") {
+                    pushObjectSections(parts, "실행 로드맵", roadmapKw);
+                }
+
+                // 리스크 & 대응 (키워드 분석)
+                const riskKw = pick(analysisData, KEYWORD_RISK_KEYS);
+                if (riskKw && typeof riskKw === "object") {
+                    pushObjectSections(parts, "리스크 & 대응", riskKw);
+                }
+
+                // 부록 (키워드 분석)
+                const appendixKw = pick(analysisData, KEYWORD_APPENDIX_KEYS);
+                if (appendixKw && typeof appendixKw === "object") {
+                    pushObjectSections(parts, "부록", appendixKw);
+                }
+            } else if (targetType === "comprehensive" && analysisData) {
+                // 종합 분석 상세 포맷팅 (키워드 + 오디언스 통합, 동일 문서 스타일)
+
+                // Executive Summary (문자열 정규화·중복/API 메시지 제거)
+                let execSummaryComp = pick(analysisData, SUMMARY_KEYS);
+                execSummaryComp = summaryText(execSummaryComp);
+                if (execSummaryComp && typeof execSummaryComp === "string") {
+                    pushSummarySection(parts, execSummaryComp);
+                }
+
+                // Key Findings (배열·객체·primary_insights/quantitative_metrics 동일 스타일)
+                const keyFindingsComp = pick(analysisData, FINDINGS_KEYS);
+                const keyFindingsCompKind = kindOf(keyFindingsComp);
+                if (keyFindingsComp) {
+                    parts.push("## 주요 발견사항 (Key Findings)\\n\\n");
+                    if (keyFindingsCompKind === KIND_ARRAY && keyFindingsComp.length > 0) {
+                        pushFindingItems(parts, keyFindingsComp);
+                    } else {
+                        pushNumberedSection(parts, "### 핵심 인사이트\\n\\n", keyFindingsComp.primary_insights);
+                    }
+                    if (keyFindingsComp.quantitative_metrics && typeof keyFindingsComp.quantitative_metrics === "object") {
+                        parts.push("### 정량적 지표\\n\\n");
+                        appendValueForReport(parts, keyFindingsComp.quantitative_metrics);
+                        parts.push("\\n\\n");
+                    }
+                    if (keyFindingsCompKind === KIND_OBJECT) {
+                        for (const [key, value] of Object.entries(keyFindingsComp)) {
+                            if (SKIP_SECTION_KEYS.has(key) || !value) continue;
+                            pushValueSection(parts, "###", key, value);
+                        }
+                    }
+                } else if (analysisData.key_points && analysisData.key_points.length > 0) {
+                    parts.push("## 주요 포인트\\n\\n");
+                    emitNumberedList(parts, analysisData.key_points);
+                }
+
+                // Integrated Analysis (키워드 + 오디언스 통합)
+                // 1. 기존 integrated_analysis 구조 지원
+                const integrated = pick(analysisData, INTEGRATED_KEYS);
+
+                // 2. 개별 섹션 구조 지원 (keyword_analysis, audience_analysis 등)
+                const keywordAnalysis = analysisData.keyword_analysis;
+                const audienceAnalysis = analysisData.audience_analysis;
+                const competitiveAnalysis = analysisData.competitive_analysis;
+                const strategicRecs = analysisData.strategic_recommendations;
+                const roadmap = analysisData.execution_roadmap;
+
+                // 통합 분석 타이틀
+                parts.push("## 통합 분석 (Integrated Analysis)\\n\\n");
+
+                // A. Keyword Analysis Section
+                if (keywordAnalysis) {
+                    parts.push("### 키워드 분석 (Keyword Analysis)\\n\\n");
+                    if (typeof keywordAnalysis === "string") {
+                        parts.push(keywordAnalysis + "\\n\\n");
+                    } else {
+                        for (const [key, value] of Object.entries(keywordAnalysis)) {
+                            if (SKIP_SECTION_KEYS.has(key) || !value) continue;
+                            // 포맷팅된 키 이름 사용
+                            let label = key.replace(/_/g, ' ').replace(/([A-Z])/g, ' $1').trim();
+                            label = label.charAt(0).toUpperCase() + label.slice(1);
+                            pushValueSection(parts, "####", label, value);
+                        }
+                    }
+                }
+
+                // B. Audience Analysis Section
+                if (audienceAnalysis) {
+                    parts.push("### 오디언스 분석 (Audience Analysis)\\n\\n");
+                    if (typeof audienceAnalysis === "string") {
+                        parts.push(audienceAnalysis + "\\n\\n");
+                    } else {
+                        for (const [key, value] of Object.entries(audienceAnalysis)) {
+                            if (SKIP_SECTION_KEYS.has(key) || !value) continue;
+                            let label = key.replace(/_/g, ' ').replace(/([A-Z])/g, ' $1').trim();
+                            label = label.charAt(0).toUpperCase() + label.slice(1);
+                            pushValueSection(parts, "####", label, value);
+                        }
+                    }
+                }
+
+                // C. Competitive Analysis Section
+                if (competitiveAnalysis) {
+                    parts.push("### 경쟁 분석 (Competitive Analysis)\\n\\n");
+                    if (typeof competitiveAnalysis === "string") {
+                        parts.push(competitiveAnalysis + "\\n\\n");
+                    } else {
+                        for (const [key, value] of Object.entries(competitiveAnalysis)) {
+                            if (SKIP_SECTION_KEYS.has(key) || !value) continue;
+                            let label = key.replace(/_/g, ' ').replace(/([A-Z])/g, ' $1').trim();
+                            label = label.charAt(0).toUpperCase() + label.slice(1);
+                            pushValueSection(parts, "####", label, value);
+                        }
+                    }
+                }
+
+                if (integrated) {
+                    // Keyword-Audience Alignment
+                    if (integrated.keyword_audience_alignment) {
+                        parts.push("### 키워드-오디언스 정렬 분석\\n\\n");
+                        const align = integrated.keyword_audience_alignment;
+                        if (align.search_intent_match) parts.push("- **검색 의도-오디언스 매칭**: ", align.search_intent_match, "\\n");
+                        if (align.keyword_opportunity_for_audience) parts.push("- **오디언스 타겟팅 키워드 기회**: ", align.keyword_opportunity_for_audience, "\\n");
+                        if (align.audience_preferred_keywords) parts.push("- **오디언스 선호 키워드**: ", align.audience_preferred_keywords, "\\n");
+                        if (align.content_gap_analysis) parts.push("- **콘텐츠 공백 분석**: ", align.content_gap_analysis, "\\n");
+                        parts.push("\\n");
+                    }
+
+                    // Core Keyword Insights
+                    if (integrated.core_keyword_insights) {
+                        parts.push("### 핵심 키워드 인사이트\\n\\n");
+                        const kw = integrated.core_keyword_insights;
+                        if (kw.primary_search_intent) parts.push("- **주요 검색 의도**: ", kw.primary_search_intent, "\\n");
+                        pushNumberedSection(parts, "#### 주요 기회 키워드\\n\\n", kw.key_opportunity_keywords);
+                        pushNumberedSection(parts, "#### 트렌딩 키워드\\n\\n", kw.trending_keywords);
+                        if (kw.search_volume_trend) parts.push("- **검색량 트렌드**: ", kw.search_volume_trend, "\\n\\n");
+                    }
+
+                    // Core Audience Insights
+                    if (integrated.core_audience_insights) {
+                        parts.push("### 핵심 오디언스 인사이트\\n\\n");
+                        const aud = integrated.core_audience_insights;
+
+                        if (aud.target_demographics) {
+                            parts.push("#### 타겟 인구통계\\n\\n");
+                            const demo = aud.target_demographics;
+                            emitLabeledFields(parts, demo, CORE_DEMO_LABELS);
+                            if (demo.expected_occupations && Array.isArray(demo.expected_occupations)) {
+                                parts.push("- **예상 직업군**: ", demo.expected_occupations.join(', '), "\\n");
+                            }
+                            parts.push("\\n");
+                        }
+
+                        if (aud.key_behavior_patterns) {
+                            pushLabeledSection(parts, "#### 주요 행동 패턴\\n\\n", aud.key_behavior_patterns, CORE_BEHAVIOR_LABELS);
+                        }
+
+                        if (aud.core_values_and_needs) {
+                            parts.push("#### 핵심 가치 및 니즈\\n\\n");
+                            const val = aud.core_values_and_needs;
+                            if (val.primary_values && Array.isArray(val.primary_values)) {
+                                parts.push("- **주요 가치**: ", val.primary_values.join(', '), "\\n");
+                            }
+                            if (val.main_pain_points && Array.isArray(val.main_pain_points)) {
+                                parts.push("- **주요 페인 포인트**: ", val.main_pain_points.join(', '), "\\n");
+                            }
+                            if (val.key_aspirations && Array.isArray(val.key_aspirations)) {
+                                parts.push("- **핵심 열망**: ", val.key_aspirations.join(', '), "\\n");
+                            }
+                            parts.push("\\n");
+                        }
+                    }
+
+                    // Trends and Patterns
+                    if (integrated.trends_and_patterns) {
+                        parts.push("### 트렌드 및 패턴\\n\\n");
+                        const trends = integrated.trends_and_patterns;
+                        if (trends.converging_trends && Array.isArray(trends.converging_trends)) {
+                            emitNumberedList(parts, trends.converging_trends);
+                        }
+                        if (trends.period_analysis) parts.push("- **기간별 분석**: ", trends.period_analysis, "\\n");
+                        if (trends.future_outlook) parts.push("- **향후 전망**: ", trends.future_outlook, "\\n");
+                        parts.push("\\n");
+                    }
+                }
+
+                // Forward-Looking Recommendations
+                if (analysisData.forward_looking_recommendations) {
+                    parts.push("## 앞으로의 제안 방향 (Forward-Looking Recommendations)\\n\\n");
+                    const rec = analysisData.forward_looking_recommendations;
+
+                    pushNumberedSection(parts, "### 즉시 실행 가능한 액션\\n\\n", rec.immediate_actions);
+
+                    if (rec.content_strategy) {
+                        parts.push("### 콘텐츠 전략\\n\\n");
+                        const cs = rec.content_strategy;
+                        pushNumberedSection(parts, "#### 추천 주제\\n\\n", cs.recommended_topics);
+                        if (cs.content_format) parts.push("- **콘텐츠 형식**: ", cs.content_format, "\\n");
+                        if (cs.distribution_channels && Array.isArray(cs.distribution_channels)) {
+                            parts.push("- **배포 채널**: ", cs.distribution_channels.join(', '), "\\n");
+                        }
+                        parts.push("\\n");
+                    }
+
+                    if (rec.marketing_strategy) {
+                        pushLabeledSection(parts, "### 마케팅 전략\\n\\n", rec.marketing_strategy, MARKETING_STRATEGY_LABELS);
+                    }
+
+                    pushNumberedSection(parts, "### 단기 목표 (3-6개월)\\n\\n", rec.short_term_goals);
+                    pushNumberedSection(parts, "### 장기 비전 (6개월 이상)\\n\\n", rec.long_term_vision);
+
+                    if (rec.success_metrics) {
+                        pushLabeledSection(parts, "### 성공 지표\\n\\n", rec.success_metrics, SUCCESS_METRIC_LABELS);
+                    }
+                }
+
+                // D. Strategic Recommendations (Enhanced)
+                if (strategicRecs) {
+                    parts.push("## 전략적 제안 (Strategic Recommendations)\\n\\n");
+                    if (typeof strategicRecs === "string") {
+                        parts.push(strategicRecs + "\\n\\n");
+                    } else {
+                        // 특정 필드가 있는 경우 우선 처리 (기존 로직 유지)
+                        pushNumberedSection(parts, "### 콘텐츠 차별화 전략\\n\\n", strategicRecs.content_differentiation);
+                        if (strategicRecs.pricing_strategy) {
+                            parts.push("### 가격 전략\\n\\n", strategicRecs.pricing_strategy, "\\n\\n");
+                        }
+                        if (strategicRecs.partnership_opportunities) {
+                            parts.push("### 파트너십 기회\\n\\n", strategicRecs.partnership_opportunities, "\\n\\n");
+                        }
+
+                        // 그 외 모든 필드 처리 (Generic)
+                        for (const [key, value] of Object.entries(strategicRecs)) {
+                            if (COMPREHENSIVE_RECS_SPECIAL.has(key)) continue;
+                            if (SKIP_SECTION_KEYS.has(key) || !value) continue;
+
+                            let label = key.replace(/_/g, ' ').replace(/([A-Z])/g, ' $1').trim();
+                            label = label.charAt(0).toUpperCase() + label.slice(1);
+                            pushValueSection(parts, "###", label, value);
+                        }
+                    }
+                }
+
+                // E. Execution Roadmap
+                if (roadmap) {
+                    parts.push("## 실행 로드맵 (Execution Roadmap)\\n\\n");
+                    if (typeof roadmap === "string") {
+                        parts.push(roadmap + "\\n\\n");
+                    } else {
+                        for (const [key, value] of Object.entries(roadmap)) {
+                            if (SKIP_SECTION_KEYS.has(key) || !value) continue;
+                            let label = key.replace(/_/g, ' ').replace(/([A-Z])/g, ' $1').trim();
+                            label = label.charAt(0).toUpperCase() + label.slice(1);
+                            pushValueSection(parts, "###", label, value);
+                        }
+                    }
+                }
+
+                // F. Risks & Governance
+                const risks = pick(analysisData, RISK_KEYS);
+                if (risks) {
+                    parts.push("## 리스크 & 거버넌스 (Risks & Governance)\\n\\n");
+                    if (typeof risks === "string") {
+                        parts.push(risks + "\\n\\n");
+                    } else {
+                        for (const [key, value] of Object.entries(risks)) {
+                            if (SKIP_SECTION_KEYS.has(key) || !value) continue;
+                            let label = key.replace(/_/g, ' ').replace(/([A-Z])/g, ' $1').trim();
+                            label = label.charAt(0).toUpperCase() + label.slice(1);
+                            pushValueSection(parts, "###", label, value);
+                        }
+                    }
+                }
+
+                // G. Appendix
+                const appendix = pick(analysisData, APPENDIX_KEYS);
+                if (appendix) {
+                    parts.push("## 부록 (Appendix)\\n\\n");
+                    if (typeof appendix === "string") {
+                        parts.push(appendix + "\\n\\n");
+                    } else {
+                        for (const [key, value] of Object.entries(appendix)) {
+                            if (SKIP_SECTION_KEYS.has(key) || !value) continue;
+                            let label = key.replace(/_/g, ' ').replace(/([A-Z])/g, ' $1').trim();
+                            label = label.charAt(0).toUpperCase() + label.slice(1);
+                            pushValueSection(parts, "###", label, value);
+                        }
+                    }
+                }
+
+                if (analysisData.recommendations && analysisData.recommendations.length > 0) {
+                    parts.push("## 경쟁 전략\\n\\n");
+                    emitNumberedList(parts, analysisData.recommendations);
+                }
+
+                // Metrics (하위 호환성 - key_findings가 없을 때만)
+                if (analysisData.metrics && !analysisData.key_findings) {
+                    pushLabeledSection(parts, "## 지표\\n\\n", analysisData.metrics, COMPETITOR_METRIC_LABELS);
+                }
+            }
+
+            // 추가 분석 데이터 표시 (sentiment, context, tone, recommendations, analysis_sources)
+            // analysisData와 data.data 모두에서 확인
+            const sentimentData = analysisData?.sentiment || data.data?.sentiment;
+            const contextData = analysisData?.context || data.data?.context;
+            const toneData = analysisData?.tone || data.data?.tone;
+            const recommendationsData = analysisData?.recommendations || data.data?.recommendations;
+            const analysisSources = analysisData?.analysis_sources || data.data?.analysis_sources;
+
+            // Sentiment 분석
+            if (sentimentData && typeof sentimentData === "object") {
+                parts.push("## 감정 분석 (Sentiment Analysis)\\n\\n");
+                const sentiment = sentimentData;
+                if (sentiment.overall_sentiment) parts.push("- **전체 감정**: ", sentiment.overall_sentiment, "\\n");
+                if (sentiment.sentiment_score !== undefined && sentiment.sentiment_score !== null) {
+                    parts.push("- **감정 점수**: ", sentiment.sentiment_score, "\\n");
+                }
+                if (hasItems(sentiment.positive_aspects)) {
+                    parts.push("- **긍정적 측면**:\\n");
+                    emitIndentedList(parts, sentiment.positive_aspects);
+                }
+                if (hasItems(sentiment.negative_aspects)) {
+                    parts.push("- **부정적 측면**:\\n");
+                    emitIndentedList(parts, sentiment.negative_aspects);
+                }
+                if (sentiment.emotional_tone) parts.push("- **감정적 톤**: ", sentiment.emotional_tone, "\\n");
+                // sentiment 객체의 다른 필드들도 동적으로 표시
+                for (const [key, value] of Object.entries(sentiment)) {
+                    if (!SENTIMENT_SPECIAL.has(key) && value) {
+                        if (Array.isArray(value)) {
+                            parts.push("- **", key, "**: ", value.join(', '), "\\n");
+                        } else {
+                            parts.push("- **", key, "**: ", value, "\\n");
+                        }
+                    }
+                }
+                parts.push("\\n");
+            }
+
+            // Context 분석
+            if (contextData && typeof contextData === "object") {
+                parts.push("## 맥락 분석 (Context Analysis)\\n\\n");
+                const context = contextData;
+                if (context.industry_context) parts.push("- **산업 맥락**: ", context.industry_context, "\\n");
+                if (context.market_context) parts.push("- **시장 맥락**: ", context.market_context, "\\n");
+                if (context.social_context) parts.push("- **사회적 맥락**: ", context.social_context, "\\n");
+                if (context.cultural_context) parts.push("- **문화적 맥락**: ", context.cultural_context, "\\n");
+                if (context.temporal_context) parts.push("- **시대적 맥락**: ", context.temporal_context, "\\n");
+                if (hasItems(context.related_events)) {
+                    parts.push("- **관련 이벤트**:\\n");
+                    emitIndentedList(parts, context.related_events);
+                }
+                // context 객체의 다른 필드들도 동적으로 표시 (동일 문서 스타일)
+                for (const [key, value] of Object.entries(context)) {
+                    if (!CONTEXT_SPECIAL.has(key) && value) {
+                        parts.push("- **" + (key) + "**: " + (typeof value === "object" ? formatValueForReport(value) : value) + "\\n");
+                    }
+                }
+                parts.push("\\n");
+            }
+
+            // Tone 분석
+            if (toneData && typeof toneData === "object") {
+                parts.push("## 톤 분석 (Tone Analysis)\\n\\n");
+                const tone = toneData;
+                if (tone.overall_tone) parts.push("- **전체 톤**: ", tone.overall_tone, "\\n");
+                if (tone.communication_style) parts.push("- **커뮤니케이션 스타일**: ", tone.communication_style, "\\n");
+                if (tone.formality_level) parts.push("- **격식 수준**: ", tone.formality_level, "\\n");
+                if (tone.energy_level) parts.push("- **에너지 수준**: ", tone.energy_level, "\\n");
+                if (hasItems(tone.recommended_tone)) {
+                    parts.push("- **권장 톤**:\\n");
+                    emitIndentedList(parts, tone.recommended_tone);
+                }
+                // tone 객체의 다른 필드들도 동적으로 표시
+                for (const [key, value] of Object.entries(tone)) {
+                    if (!TONE_SPECIAL.has(key) && value) {
+                        if (Array.isArray(value)) {
+                            parts.push("- **", key, "**: ", value.join(', '), "\\n");
+                        } else {
+                            parts.push("- **", key, "**: ", value, "\\n");
+                        }
+                    }
+                }
+                parts.push("\\n");
+            }
+
+            // Recommendations (키워드 추천 등) - strategic_recommendations와 중복되지 않도록 확인
+            if (recommendationsData && !analysisData?.strategic_recommendations) {
+                if (isObjectRecord(recommendationsData)) {
+                    parts.push("## 키워드 추천 (Keyword Recommendations)\\n\\n");
+                    const recs = recommendationsData;
+
+                    if (hasItems(recs.semantic_keywords)) {
+                        parts.push("### 의미적 관련 키워드\\n\\n");
+                        for (let idx = 0, len = recs.semantic_keywords.length; idx < len; idx++) {
+                            const kw = recs.semantic_keywords[idx];
+                            const keyword = typeof kw === "string" ? kw : (kw.keyword || kw);
+                            const score = kw.score ? ' (점수: ' + kw.score + ')' : '';
+                            parts.push(ordinal(idx) + keyword + score + '\\n');
+                        }
+                        parts.push("\\n");
+                    }
+
+                    if (hasItems(recs.co_occurring_keywords)) {
+                        parts.push("### 공기 키워드\\n\\n");
+                        for (let idx = 0, len = recs.co_occurring_keywords.length; idx < len; idx++) {
+                            const kw = recs.co_occurring_keywords[idx];
+                            const keyword = typeof kw === "string" ? kw : (kw.keyword || kw);
+                            parts.push(ordinal(idx) + keyword + '\\n');
+                        }
+                        parts.push("\\n");
+                    }
+
+                    if (hasItems(recs.long_tail_keywords)) {
+                        parts.push("### 롱테일 키워드\\n\\n");
+                        for (let idx = 0, len = recs.long_tail_keywords.length; idx < len; idx++) {
+                            const kw = recs.long_tail_keywords[idx];
+                            const keyword = typeof kw === "string" ? kw : (kw.keyword || kw);
+                            parts.push(ordinal(idx) + keyword + '\\n');
+                        }
+                        parts.push("\\n");
+                    }
+
+                    if (hasItems(recs.trending_keywords)) {
+                        parts.push("### 트렌딩 키워드\\n\\n");
+                        for (let idx = 0, len = recs.trending_keywords.length; idx < len; idx++) {
+                            const kw = recs.trending_keywords[idx];
+                            const keyword = typeof kw === "string" ? kw : (kw.keyword || kw);
+                            parts.push(ordinal(idx) + keyword + '\\n');
+                        }
+                        parts.push("\\n");
+                    }
+
+                    // recommendations 객체의 다른 필드들도 동적으로 표시
+                    for (const [key, value] of Object.entries(recs)) {
+                        if (!KEYWORD_RECS_SPECIAL.has(key) && value) {
+                            if (Array.isArray(value) && value.length > 0) {
+                                parts.push("### ", key, "\\n\\n");
+                                for (let idx = 0, len = value.length; idx < len; idx++) {
+                                    const item = value[idx];
+                                    const keyword = typeof item === "string" ? item : (item.keyword || item);
+                                    parts.push(ordinal(idx) + keyword + '\\n');
+                                }
+                                parts.push("\\n");
+                            }
+                        }
+                    }
+                } else if (Array.isArray(recommendationsData) && recommendationsData.length > 0) {
+                    parts.push("## 키워드 추천\\n\\n");
+                    for (let idx = 0, len = recommendationsData.length; idx < len; idx++) {
+                        const rec = recommendationsData[idx];
+                        const keyword = typeof rec === "string" ? rec : (rec.keyword || rec);
+                        parts.push(ordinal(idx) + (keyword) + "\\n");
+                    }
+                    parts.push("\\n");
+                }
+            }
+
+            // Analysis Sources
+            pushNumberedSection(parts, "## 📚 분석 출처 (Analysis Sources)\\n\\n", analysisSources);
+
+            // 영문/한글 키가 있는 경우 직접 처리 (오디언스 분석)
+            if (targetType === "audience" && analysisData && !partsInclude(parts, "Executive Summary") && !partsInclude(parts, "주요 발견사항")) {
+                // 영문/한글 키로 직접 데이터 표시
+                // 1. sections 배열이 있는 경우 (Gemini가 가끔 이 구조로 반환함)
+                if (analysisData.sections && Array.isArray(analysisData.sections)) {
+                    console.log("sections 구조 감지됨, 동적 렌더링 시작");
+                    if (analysisData.title) {
+                        parts.push("# ", analysisData.title, "\\n\\n");
+                    }
+
+                    for (const section of analysisData.sections) {
+                        // 제목 처리 (heading or title)
+                        var title = section.heading || section.title || "";
+                        if (title) {
+                            parts.push("## ", title, "\\n\\n");
+                        }
+
+                        // 내용 처리 (content or body or subsections)
+                        var content = section.content || section.body || section.subsections || "";
+
+                        if (Array.isArray(content)) {
+                            // subsections 등 배열인 경우
+                            for (const sub of content) {
+                                if (typeof sub === "string") {
+                                    parts.push(sub + "\\n\\n");
+                                } else if (typeof sub === "object") {
+                                    var subTitle = sub.heading || sub.title || "";
+                                    var subContent = sub.content || sub.body || "";
+                                    if (subTitle) parts.push("### ", subTitle, "\\n\\n");
+                                    if (subContent) {
+                                        appendValueForReport(parts, subContent);
+                                        parts.push("\\n\\n");
+                                    }
+                                }
+                            }
+                        } else if (typeof content === "object") {
+                            appendValueForReport(parts, content);
+                            parts.push("\\n\\n");
+                        } else {
+                            parts.push(content + "\\n\\n");
+                        }
+                    }
+                }
+
+                // 2. 키 정규화 (1. Executive Summary -> Executive Summary)
+                // AI가 번호가 붙은 키를 반환하는 경우를 처리
+                for (const [key, value] of Object.entries(analysisData)) {
+                    var cleanKey = key.replace(/^\d+[\._]\s?/, '').trim();
+                    if (cleanKey !== key && !analysisData[cleanKey]) {
+                        // console.log("키 정규화:", key, "->", cleanKey);
+                        analysisData[cleanKey] = value;
+                    }
+                }
+
+                // 3. 기존 키 기반 렌더링 (Executive Summary 등)
+                if (analysisData["Executive Summary"]) {
+                    parts.push("## Executive Summary\\n\\n", analysisData["Executive Summary"], "\\n\\n");
+                }
+                for (const section of DIRECT_SECTIONS) {
+                    const value = analysisData[section.key];
+                    if (value) pushDirectSection(parts, section, value);
+                }
+            }
+
+            // 결과가 비어있는 경우 처리 (보고서 헤더 이후 추가된 내용이 없는지 확인)
+
+            // 결과가 기본 헤더만 있는지 확인 (영문/한글 키가 있으면 더 이상 체크하지 않음, 키 목록은 한 번만 순회)
+            const hasDirectKeys = DIRECT_REPORT_KEYS.some(k => analysisData[k]);
+            if (partsLength(parts, baseCount) <= 50 && !hasDirectKeys) {
+                parts.push(
+                    "## ⚠️ 분석 결과 없음\\n\\n",
+                    "분석 데이터를 받지 못했습니다.\\n\\n",
+                    "**디버깅 정보**:\\n",
+                    "- 받은 데이터 타입: " + (typeof data.data) + "\\n",
+                    "- analysisData 타입: " + (typeof analysisData) + "\\n"
+                );
+                const analysisDataKeys = Object.keys(analysisData || {});
+                const dataKeys = Object.keys(data.data || {});
+                parts.push(
+                    "- analysisData 키: " + analysisDataKeys.join(', ') + "\\n",
+                    "- data.data 키: " + dataKeys.join(', ') + "\\n\\n",
+                    "**전체 응답 구조**:\\n",
+                    "```json\\n" + JSON.stringify({success: data.success, dataKeys: dataKeys, analysisDataKeys: analysisDataKeys}, null, 2) + "\\n```\\n\\n",
+                    "**해결 방법**:\\n",
+                    "1. AI API 키가 설정되어 있는지 확인하세요 (OpenAI 또는 Gemini)\\n",
+                    "2. 서버 로그를 확인하세요\\n",
+                    "3. 브라우저 콘솔에서 상세한 오류 메시지를 확인하세요\\n\\n"
+                );
+            }
+
+            parts.push("---\\n\\n", "*본 보고서는 AI 기반 분석 결과입니다.*\\n");
+
+            const resultText = parts.join("");
+            const { markdownToReportHtml } = await loadReportRenderer();
+            resultContent.innerHTML = markdownToReportHtml(resultText);
+            // 보고서 텍스트는 "\\n" 문자열로 줄을 구분하므로 실제 줄바꿈으로 바꿔 복사용으로 보관
+            resultCopyText = resultText.replace(/\\n/g, "\n");
+            setPanelState("result");
+        } else if (data && !data.success) {
+            // 에러가 있는 경우 에러 메시지 표시
+            throw new Error(data.error || "분석 결과를 받지 못했습니다.");
+        } else if (!data) {
+            // data가 null인 경우
+            throw new Error("분석 결과를 받지 못했습니다. 서버 상태를 확인해주세요.");
+        }
+    } catch (err) {
+        console.error("분석 요청 오류:", err);
+        error.textContent = "오류: " + (err.message || "알 수 없는 오류가 발생했습니다.");
+        setPanelState("error");
+    } finally {
+        // 스트리밍 중 표시된 결과가 있으면 로딩 표시만 내림
+        if (EL.resultsPanel.dataset.state === "streaming") {
+            setPanelState("result");
+        }
+        analyzeBtn.disabled = false;
+
+        // 진행률 애니메이션/예약된 갱신 정리 (혹시 남아있을 수 있음)
+        stopProgressUpdates();
+    }
+});
@@ -0,0 +1,71 @@
+// 분석 결과 보고서 렌더러 (Markdown 형식 텍스트 → 보고서 HTML)
+// 최종 결과 표시 시점에만 필요하므로 랜딩 페이지에서 동적 import로 지연 로드
+
+const ESC = { "&": "&amp;", "<": "&lt;", ">": "&gt;", "\"": "&quot;" };
+
+// 이스케이프 대상 문자와 **굵게** 구간을 한 번의 스캔으로 처리
+const INLINE_RE = /[&<>"]|\*\*([^*]+)\*\*/g;
+const ESCAPE_RE = /[&<>"]/g;
+
+// 보고서 텍스트는 "\\n" 문자열(백슬래시+n)로 줄을 구분하고, 서버 값에는 실제 줄바꿈이 섞일 수 있음
+const LINE_SPLIT_RE = /\\n|\r?\n/;
+const ORDERED_ITEM_RE = /^\d+\.\s/;
+
+function escapeText(s) {
+    return s.replace(ESCAPE_RE, function(ch) { return ESC[ch]; });
+}
+
+function renderInline(s) {
+    return s.replace(INLINE_RE, function(match, bold) {
+        return bold !== undefined ? "<strong>" + escapeText(bold) + "</strong>" : ESC[match];
+    });
+}
+
+export function markdownToReportHtml(text) {
+    if (!text || typeof text !== "string") return "<div class=\"report-body\"></div>";
+    const lines = text.split(LINE_SPLIT_RE);
+    const out = ["<div class=\"report-body\">"];
+    let listTag = null;
+
+    function openList(tag) {
+        if (listTag === tag) return;
+        closeList();
+        out.push("<" + tag + " class=\"report-" + tag + "\">");
+        listTag = tag;
+    }
+    function closeList() {
+        if (listTag) {
+            out.push("</" + listTag + ">");
+            listTag = null;
+        }
+    }
+
+    for (let i = 0; i < lines.length; i++) {
+        const trimmed = lines[i].trim();
+        if (trimmed === "" || trimmed === "---") {
+            closeList();
+            if (trimmed === "---") out.push("<hr class=\"report-hr\" />");
+        } else if (trimmed.startsWith("### ")) {
+            closeList();
+            out.push("<h3 class=\"report-h3\">" + escapeText(trimmed.slice(4)) + "</h3>");
+        } else if (trimmed.startsWith("## ")) {
+            closeList();
+            out.push("<h2 class=\"report-h2\">" + escapeText(trimmed.slice(3)) + "</h2>");
+        } else if (trimmed.startsWith("# ")) {
+            closeList();
+            out.push("<h1 class=\"report-h1\">" + escapeText(trimmed.slice(2)) + "</h1>");
+        } else if (trimmed.startsWith("- ")) {
+            openList("ul");
+            out.push("<li class=\"report-li\">" + renderInline(trimmed.slice(2)) + "</li>");
+        } else if (ORDERED_ITEM_RE.test(trimmed)) {
+            openList("ol");
+            out.push("<li class=\"report-li\">" + renderInline(trimmed.replace(ORDERED_ITEM_RE, "")) + "</li>");
+        } else {
+            closeList();
+            out.push("<p class=\"report-p\">" + renderInline(trimmed) + "</p>");
+        }
+    }
+    closeList();
+    out.push("</div>");
+    return out.join("");
+}
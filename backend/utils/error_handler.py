@@ -5,7 +5,7 @@ API 에러 처리 표준화
 import logging
 from typing import Optional, Dict, Any
 from fastapi import HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 logger = logging.getLogger(__name__)
 
@@ -104,7 +104,7 @@ def create_error_response(
     error: Exception,
     context: Optional[str] = None,
     include_details: bool = False
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     에러 응답 생성
     
@@ -114,7 +114,7 @@ def create_error_response(
         include_details: 상세 정보 포함 여부 (프로덕션에서는 False)
         
     Returns:
-        JSONResponse
+        ORJSONResponse
     """
     if isinstance(error, APIError):
         status_code = error.status_code
@@ -145,7 +145,7 @@ def create_error_response(
         if include_details:
             error_detail["details"] = str(error)
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status_code,
         content={
             "success": False,
@@ -0,0 +1,120 @@
+"""
+프론트엔드 빌드 산출물(SPA) 서빙 유틸리티
+
+빌드 디렉토리는 배포 후 변경되지 않으므로 시작 시 한 번만 읽어 두고,
+요청마다 파일 시스템을 다시 열지 않도록 합니다.
+"""
+import hashlib
+import logging
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+# Vite/React 빌드가 생성하는 확장자별 MIME 타입
+# (요청마다 mimetypes.guess_type을 호출하지 않도록 미리 계산)
+MIME_TYPES: Dict[str, str] = {
+    ".html": "text/html; charset=utf-8",
+    ".js": "application/javascript; charset=utf-8",
+    ".mjs": "application/javascript; charset=utf-8",
+    ".css": "text/css; charset=utf-8",
+    ".json": "application/json",
+    ".map": "application/json",
+    ".webmanifest": "application/manifest+json",
+    ".txt": "text/plain; charset=utf-8",
+    ".svg": "image/svg+xml",
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+    ".avif": "image/avif",
+    ".ico": "image/x-icon",
+    ".woff": "font/woff",
+    ".woff2": "font/woff2",
+    ".ttf": "font/ttf",
+    ".wasm": "application/wasm",
+}
+DEFAULT_MIME_TYPE = "application/octet-stream"
+
+
+def get_media_type(path: str) -> str:
+    """확장자 기반 MIME 타입 조회"""
+    return MIME_TYPES.get(os.path.splitext(path)[1].lower(), DEFAULT_MIME_TYPE)
+
+
+def make_weak_etag(data: bytes) -> str:
+    """콘텐츠 기반 약한(weak) ETag 생성"""
+    return 'W/"' + hashlib.blake2b(data, digest_size=16).hexdigest() + '"'
+
+
+class EarlyHintsResponse(Response):
+    """
+    본 응답 전에 103 Early Hints를 보내는 응답
+
+    ASGI 서버가 ``http.response.early_hint`` 확장을 지원하는 경우에만 전송하며,
+    지원하지 않으면 일반 Response와 동일하게 동작합니다.
+    """
+
+    def __init__(self, *args, early_hints: Sequence[bytes] = (), **kwargs):
+        super().__init__(*args, **kwargs)
+        self.early_hints = early_hints
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if self.early_hints and "http.response.early_hint" in scope.get("extensions", {}):
+            await send({"type": "http.response.early_hint", "links": list(self.early_hints)})
+        await super().__call__(scope, receive, send)
+
+
+class FrontendAssets:
+    """
+    프론트엔드 빌드 디렉토리 스냅샷
+
+    - index.html은 bytes로 미리 로드하고 ETag를 한 번만 계산
+    - 나머지 정적 파일은 상대 경로 → 실제 경로 딕셔너리로 보관
+    - 엔트리 번들(assets/index-*.js, .css)은 Early Hints용 preload 링크로 보관
+    """
+
+    def __init__(self, directory: Path, url_prefix: str = "/app"):
+        self.directory = directory
+        self.index_html: bytes = (directory / "index.html").read_bytes()
+        self.index_etag: str = make_weak_etag(self.index_html)
+        # 디렉토리는 시작 시 한 번만 순회 (요청 시 stat 호출 없음)
+        self.files: Dict[str, Path] = {
+            path.relative_to(directory).as_posix(): path
+            for path in directory.rglob("*")
+            if path.is_file()
+        }
+        self.early_hints: List[bytes] = self._build_early_hints(url_prefix)
+
+    def _build_early_hints(self, url_prefix: str) -> List[bytes]:
+        """엔트리 JS/CSS 번들에 대한 preload Link 헤더 값 목록"""
+        links = []
+        for rel_path in sorted(self.files):
+            name = rel_path.rsplit("/", 1)[-1]
+            if not (rel_path.startswith("assets/") and name.startswith("index-")):
+                continue
+            if name.endswith(".js"):
+                as_ = "script"
+            elif name.endswith(".css"):
+                as_ = "style"
+            else:
+                continue
+            links.append(f"<{url_prefix}/{rel_path}>; rel=preload; as={as_}".encode())
+        return links
+
+    @classmethod
+    def load(cls, directory: Path, url_prefix: str = "/app") -> Optional["FrontendAssets"]:
+        """index.html이 있는 빌드 디렉토리만 로드 (없으면 None)"""
+        if not (directory / "index.html").is_file():
+            logger.info(f"index.html이 없어 SPA 폴백을 사용하지 않습니다: {directory}")
+            return None
+        return cls(directory, url_prefix)
+
+    def get_file(self, path: str) -> Optional[Path]:
+        """요청 경로에 해당하는 정적 파일 (없으면 None → SPA 폴백)"""
+        return self.files.get(path)
@@ -0,0 +1,169 @@
+"""
+사전 압축된 정적 응답 (pure ASGI)
+
+요청과 무관한 고정 콘텐츠(랜딩 페이지 등)를 시작 시 한 번만 인코딩/압축해 두고,
+Accept-Encoding에 맞는 버퍼를 골라 그대로 전송합니다.
+"""
+import hashlib
+import logging
+import zlib
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from starlette.types import Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    brotli = None
+    BROTLI_AVAILABLE = False
+
+Headers = List[Tuple[bytes, bytes]]
+
+# 304 응답에서는 본문 관련 헤더를 제외
+_ENTITY_HEADERS = frozenset({b"content-length", b"content-type", b"content-encoding"})
+
+
+def parse_accept_encoding(scope: Scope) -> set:
+    """요청의 Accept-Encoding 헤더에서 허용된 인코딩 집합 추출 (q=0 제외)"""
+    for name, value in scope.get("headers", []):
+        if name == b"accept-encoding":
+            encodings = set()
+            for token in value.decode("latin-1").lower().split(","):
+                coding, _, params = token.partition(";")
+                params = params.strip()
+                if params.startswith("q="):
+                    try:
+                        if float(params[2:]) == 0:
+                            continue
+                    except ValueError:
+                        continue
+                encodings.add(coding.strip())
+            return encodings
+    return set()
+
+
+def _gzip_chunks(segments: List[bytes]) -> List[bytes]:
+    """세그먼트별로 sync flush하여 앞부분만으로도 해제 가능한 gzip 청크 생성"""
+    compressor = zlib.compressobj(9, zlib.DEFLATED, 31)
+    chunks = [compressor.compress(segment) + compressor.flush(zlib.Z_SYNC_FLUSH) for segment in segments[:-1]]
+    chunks.append(compressor.compress(segments[-1]) + compressor.flush())
+    return chunks
+
+
+def _brotli_chunks(segments: List[bytes]) -> List[bytes]:
+    """세그먼트별로 flush한 brotli 청크 생성"""
+    compressor = brotli.Compressor()
+    chunks = [compressor.process(segment) + compressor.flush() for segment in segments[:-1]]
+    chunks.append(compressor.process(segments[-1]) + compressor.finish())
+    return chunks
+
+
+class PrecompressedAsset:
+    """
+    identity/gzip/br 변형을 미리 만들어 두는 ASGI 엔드포인트
+
+    GET/HEAD 라우트에 등록해 사용합니다 (예: ``app.add_route("/", asset)``).
+    ``etag=True``이면 변형별 ETag를 붙이고 If-None-Match 일치 시 304를 반환합니다.
+    ``flush_at``을 지정하면 해당 위치까지(예: ``</head>``)를 첫 청크로 먼저 전송하여
+    브라우저가 나머지를 받는 동안 리소스 요청을 시작할 수 있게 합니다.
+    """
+
+    def __init__(
+        self,
+        body: bytes,
+        media_type: str,
+        headers: Optional[Dict[str, str]] = None,
+        etag: bool = False,
+        flush_at: Optional[int] = None
+    ):
+        self.body = body
+        self.media_type = media_type
+        self.etag: Optional[str] = None
+        base_headers: Headers = [
+            (b"content-type", media_type.encode("latin-1")),
+            (b"vary", b"accept-encoding"),
+        ]
+        for key, value in (headers or {}).items():
+            base_headers.append((key.lower().encode("latin-1"), value.encode("latin-1")))
+        if etag:
+            self.etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+
+        segments = [body[:flush_at], body[flush_at:]] if flush_at else [body]
+
+        # 인코딩 우선순위: br > gzip > identity
+        self.variants: List[Tuple[str, Headers, List[bytes], Optional[bytes]]] = []
+        if BROTLI_AVAILABLE:
+            self.variants.append(("br", *self._variant(base_headers, _brotli_chunks(segments), "br")))
+        self.variants.append(("gzip", *self._variant(base_headers, _gzip_chunks(segments), "gzip")))
+        self.identity: Tuple[Headers, List[bytes], Optional[bytes]] = self._variant(base_headers, segments, None)
+
+    @classmethod
+    def from_file(
+        cls,
+        path: Path,
+        media_type: str,
+        headers: Optional[Dict[str, str]] = None,
+        etag: bool = False
+    ) -> "PrecompressedAsset":
+        """파일을 한 번 읽어 사전 압축 응답 생성"""
+        return cls(Path(path).read_bytes(), media_type=media_type, headers=headers, etag=etag)
+
+    def _variant(
+        self,
+        base_headers: Headers,
+        chunks: List[bytes],
+        encoding: Optional[str]
+    ) -> Tuple[Headers, List[bytes], Optional[bytes]]:
+        headers = list(base_headers)
+        if encoding is not None:
+            headers.append((b"content-encoding", encoding.encode("latin-1")))
+        etag = None
+        if self.etag is not None:
+            # 인코딩마다 바이트가 다르므로 강한 ETag도 변형별로 구분
+            etag = ('"' + self.etag + ("-" + encoding if encoding else "") + '"').encode("latin-1")
+            headers.append((b"etag", etag))
+        headers.append((b"content-length", str(sum(len(chunk) for chunk in chunks)).encode("latin-1")))
+        return headers, chunks, etag
+
+    def select(self, scope: Scope) -> Tuple[Headers, List[bytes], Optional[bytes]]:
+        """클라이언트가 허용하는 가장 작은 변형 선택"""
+        accepted = parse_accept_encoding(scope)
+        if accepted:
+            for encoding, headers, chunks, etag in self.variants:
+                if encoding in accepted:
+                    return headers, chunks, etag
+        return self.identity
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        headers, chunks, etag = self.select(scope)
+        if etag is not None and self._not_modified(scope, etag):
+            await send({
+                "type": "http.response.start",
+                "status": 304,
+                "headers": [header for header in headers if header[0] not in _ENTITY_HEADERS],
+            })
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        if scope["method"] == "HEAD":
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+        last = len(chunks) - 1
+        for index, chunk in enumerate(chunks):
+            await send({"type": "http.response.body", "body": chunk, "more_body": index < last})
+
+    @staticmethod
+    def _not_modified(scope: Scope, etag: bytes) -> bool:
+        """If-None-Match 헤더가 현재 ETag와 일치하는지 확인"""
+        for name, value in scope.get("headers", []):
+            if name == b"if-none-match":
+                return any(
+                    candidate.strip() in (etag, b"W/" + etag, b"*")
+                    for candidate in value.split(b",")
+                )
+        return False
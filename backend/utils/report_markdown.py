@@ -0,0 +1,147 @@
+"""
+분석 결과 Markdown 보고서 생성
+
+브라우저에서 보고서 스크립트를 실행하지 않는 API 클라이언트/내보내기용으로,
+프론트엔드 보고서와 같은 섹션 구조의 Markdown을 서버에서 바로 만듭니다.
+조각을 io.StringIO에 순서대로 기록하고 마지막에 한 번만 꺼냅니다.
+"""
+import io
+import re
+from typing import Any, Dict, Optional, Tuple
+
+# 기본 분석 모드(API 키 미설정) 경고 문구 (Executive Summary에서 제외)
+_WARNING_RE = re.compile(r"⚠️ AI API 키가 설정되지 않아|기본 분석 모드|AI API를 설정하면")
+
+# 키 이름 앞의 번호 접두어 (예: "1_executive_summary", "1. Executive Summary")
+_NUMBER_PREFIX_RE = re.compile(r"^\d+[._]\s?")
+
+TYPE_NAMES: Dict[str, str] = {
+    "keyword": "키워드",
+    "audience": "오디언스",
+    "comprehensive": "종합",
+}
+
+# (섹션 제목, 별칭 키 목록) - 섹션마다 처음으로 값이 있는 키를 사용하고, 위에서부터 순서대로 출력
+REPORT_SECTIONS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("분석 개요 (Analysis Overview)", ("analysis_overview", "Analysis Overview", "분석 개요")),
+    ("주요 발견사항 (Key Findings)", ("key_findings", "key_insights", "Key Insights", "Key Findings")),
+    ("상세 분석 (Detailed Analysis)", ("detailed_analysis", "detailed_audience_analysis", "Audience Detailed Analysis", "오디언스 상세 분석", "상세 분석")),
+    ("통합 분석 (Integrated Analysis)", ("integrated_analysis",)),
+    ("전략 제안 (Strategic Recommendations)", ("strategic_recommendations", "Strategic Recommendations", "전략 제안", "전략적 시사점")),
+    ("앞으로의 제안 방향 (Forward-Looking Recommendations)", ("forward_looking_recommendations",)),
+    ("실행 로드맵 (Execution Roadmap)", ("execution_roadmap", "Execution Roadmap", "실행 로드맵")),
+    ("리스크 & 거버넌스 (Risks & Governance)", ("risk_governance", "Risks & Governance", "리스크 & 대응", "리스크 & 거버넌스")),
+    ("부록 (Appendix)", ("appendix", "Appendix", "부록")),
+    ("감정 분석 (Sentiment)", ("sentiment",)),
+    ("맥락 분석 (Context)", ("context",)),
+    ("톤 분석 (Tone)", ("tone",)),
+    ("키워드 추천 (Keyword Recommendations)", ("recommendations",)),
+)
+
+SUMMARY_KEYS: Tuple[str, ...] = ("executive_summary", "Executive Summary", "summary")
+
+
+def _pick(data: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+    """별칭 키 중 처음으로 값이 있는(truthy) 항목 반환"""
+    for key in keys:
+        value = data.get(key)
+        if value:
+            return value
+    return None
+
+
+def _labelize(key: str) -> str:
+    """키 이름을 표시용 라벨로 변환 (예: "market_size" -> "Market Size")"""
+    return " ".join(word[:1].upper() + word[1:] for word in _NUMBER_PREFIX_RE.sub("", key).strip().split("_"))
+
+
+def _write_value(out: io.StringIO, value: Any, indent: str = "") -> None:
+    """객체/배열을 중첩 Markdown 리스트로 기록 (JSON 대신 읽기 쉬운 문서 형식)"""
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if item is None or item == "":
+                continue
+            label = _labelize(str(key))
+            if isinstance(item, (dict, list)):
+                out.write(f"{indent}- **{label}**:\n")
+                _write_value(out, item, indent + "  ")
+            else:
+                out.write(f"{indent}- **{label}**: {item}\n")
+    elif isinstance(value, list):
+        if not value:
+            out.write(f"{indent}- (내용 없음)\n")
+        elif all(isinstance(item, (str, int, float)) for item in value):
+            for index, item in enumerate(value, 1):
+                out.write(f"{indent}{index}. {item}\n")
+        else:
+            for index, item in enumerate(value, 1):
+                if isinstance(item, (dict, list)):
+                    out.write(f"{indent}{index}.\n")
+                    _write_value(out, item, indent + "   ")
+                else:
+                    out.write(f"{indent}{index}. {item}\n")
+    elif value is not None:
+        out.write(f"{indent}{value}\n")
+
+
+def _write_summary(out: io.StringIO, summary: Any) -> None:
+    """Executive Summary 기록 (API 키 경고 문구와 중복 줄 제외, 남은 줄이 없으면 생략)"""
+    if isinstance(summary, dict):
+        text = summary.get("text") or summary.get("content")
+        if not isinstance(text, str) or not text:
+            out.write("## Executive Summary\n\n")
+            _write_value(out, summary)
+            out.write("\n")
+            return
+        summary = text
+    seen = set()
+    opened = False
+    for line in str(summary).splitlines():
+        trimmed = line.strip()
+        if not trimmed or trimmed in seen or _WARNING_RE.search(trimmed):
+            continue
+        seen.add(trimmed)
+        if not opened:
+            out.write("## Executive Summary\n\n")
+            opened = True
+        out.write(trimmed + "\n")
+    if opened:
+        out.write("\n")
+
+
+def render_report_markdown(
+    result: Dict[str, Any],
+    target_keyword: Optional[str] = None,
+    target_type: Optional[str] = None
+) -> str:
+    """
+    분석 결과(analyze_target 반환값)를 Markdown 보고서 문자열로 변환
+
+    결과에 ``report`` 객체가 있으면 그것을 본문으로 사용합니다 (프론트엔드와 동일한 우선순위).
+    """
+    report = result.get("report") if isinstance(result.get("report"), dict) else result
+    keyword = target_keyword or result.get("target_keyword") or report.get("target_keyword") or ""
+    analysis_type = target_type or result.get("target_type") or report.get("target_type") or ""
+
+    out = io.StringIO()
+    out.write("# 타겟 분석 보고서\n\n")
+    out.write(f"**분석 대상**: {keyword}\n")
+    out.write(f"**분석 유형**: {TYPE_NAMES.get(analysis_type, analysis_type)} 분석\n\n")
+    out.write("---\n\n")
+
+    summary = _pick(report, SUMMARY_KEYS)
+    if summary:
+        _write_summary(out, summary)
+
+    for title, keys in REPORT_SECTIONS:
+        value = _pick(report, keys)
+        if value is None and report is not result:
+            value = _pick(result, keys)
+        if not value:
+            continue
+        out.write(f"## {title}\n\n")
+        _write_value(out, value)
+        out.write("\n")
+
+    out.write("---\n\n*본 보고서는 AI 기반 분석 결과입니다.*\n")
+    return out.getvalue()
@@ -17,5 +17,11 @@ if __name__ == "__main__":
         "backend.main:app",
         host=settings.HOST,
         port=settings.PORT,
-        reload=settings.DEBUG
+        reload=settings.DEBUG,
+        # 운영 모드: 멀티 워커 + uvloop/httptools, 요청별 access log 비활성화
+        workers=1 if settings.DEBUG else settings.WORKERS,
+        loop="auto" if settings.DEBUG else "uvloop",
+        http="auto" if settings.DEBUG else "httptools",
+        access_log=settings.DEBUG,
+        timeout_keep_alive=settings.TIMEOUT_KEEP_ALIVE
     )
@@ -20,6 +20,77 @@ class TestHealthCheck:
         assert data["status"] == "healthy"
 
 
+class TestRootPage:
+    """루트 랜딩 페이지 테스트"""
+    
+    def test_root_gzip(self):
+        """gzip 허용 시 사전 압축 본문 제공"""
+        response = client.get("/", headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "text/html; charset=utf-8"
+        assert response.headers["content-encoding"] == "gzip"
+        assert "<!DOCTYPE html>" in response.text
+    
+    def test_root_identity(self):
+        """압축 미허용 시 원본 본문 제공"""
+        response = client.get("/", headers={"Accept-Encoding": "identity"})
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+        assert int(response.headers["content-length"]) == len(response.content)
+    
+    def test_root_etag_not_modified(self):
+        """ETag 일치 시 304 반환"""
+        response = client.get("/", headers={"Accept-Encoding": "gzip"})
+        etag = response.headers["etag"]
+        assert response.headers["cache-control"] == "no-cache, must-revalidate"
+        cached = client.get("/", headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert cached.headers["etag"] == etag
+    
+    def test_root_head(self):
+        """HEAD 요청은 본문 없이 헤더만 반환"""
+        response = client.head("/")
+        assert response.status_code == 200
+        assert response.content == b""
+
+    def test_app_script_versioned(self):
+        """랜딩 페이지는 내용 해시가 붙은 app.js를 참조하고, 스크립트는 장기 캐시"""
+        html = client.get("/").text
+        assert '<script src="/static/app.js?v=' in html
+        response = client.get("/static/app.js")
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+        assert "EL.analysisForm.addEventListener" in response.text
+
+    def test_report_renderer_module(self):
+        """지연 로드되는 보고서 렌더러 모듈 제공"""
+        response = client.get("/static/report-render.js")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/javascript; charset=utf-8"
+        assert "export function markdownToReportHtml" in response.text
+
+    def test_report_renderer_versioned(self):
+        """app.js는 내용 해시가 붙은 보고서 렌더러 모듈을 import하고, 모듈은 장기 캐시"""
+        script = client.get("/static/app.js").text
+        assert 'import("/static/report-render.js?v=' in script
+        response = client.get("/static/report-render.js")
+        assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+
+
+class TestOpenAPI:
+    """OpenAPI 스키마 엔드포인트 테스트"""
+    
+    def test_openapi_schema(self):
+        """사전 직렬화된 스키마가 유효한 JSON으로 제공되는지 확인"""
+        response = client.get("/openapi.json")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        data = response.json()
+        assert data["info"]["title"] == app.title
+        assert "/api/target/analyze" in data["paths"]
+
+
 class TestTargetAnalyze:
     """타겟 분석 엔드포인트 테스트"""
     
@@ -74,6 +145,31 @@ class TestTargetAnalyze:
         data = response.json()
         assert "success" in data or "target_keyword" in data
     
+    def test_analyze_target_markdown_format(self, no_api_keys):
+        """format=markdown 요청은 서버에서 만든 Markdown 보고서 반환"""
+        response = client.post(
+            "/api/target/analyze?format=markdown",
+            json={
+                "target_keyword": "테스트 키워드",
+                "target_type": "keyword"
+            }
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "text/markdown; charset=utf-8"
+        assert response.text.startswith("# 타겟 분석 보고서")
+        assert "**분석 대상**: 테스트 키워드" in response.text
+    
+    def test_analyze_target_invalid_format(self):
+        """지원하지 않는 응답 형식 검증"""
+        response = client.post(
+            "/api/target/analyze?format=xml",
+            json={
+                "target_keyword": "test",
+                "target_type": "keyword"
+            }
+        )
+        assert response.status_code == 422
+    
     def test_analyze_target_audience_type(self, no_api_keys):
         """오디언스 타입 분석"""
         response = client.post(
@@ -178,3 +274,29 @@ class TestCORS:
         response = client.options("/api/target/analyze")
         # OPTIONS 요청은 200 또는 204를 반환해야 함
         assert response.status_code in [200, 204, 405]  # 405는 메서드 허용 안됨
+    
+    def test_cors_preflight_fast_path(self):
+        """허용된 출처의 프리플라이트는 204로 응답"""
+        response = client.options(
+            "/api/target/analyze",
+            headers={
+                "Origin": "http://localhost:3000",
+                "Access-Control-Request-Method": "POST",
+                "Access-Control-Request-Headers": "content-type",
+            }
+        )
+        assert response.status_code == 204
+        assert response.headers["access-control-allow-origin"] == "http://localhost:3000"
+        assert response.headers["access-control-allow-credentials"] == "true"
+    
+    def test_cors_preflight_disallowed_origin(self):
+        """허용되지 않은 출처는 CORSMiddleware가 거부"""
+        response = client.options(
+            "/api/target/analyze",
+            headers={
+                "Origin": "http://evil.example.com",
+                "Access-Control-Request-Method": "POST",
+            }
+        )
+        assert response.status_code == 400
+        assert "access-control-allow-origin" not in response.headers
@@ -0,0 +1,132 @@
+"""
+캐싱 미들웨어 테스트
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+from fastapi.testclient import TestClient
+from backend.middleware.cache_middleware import CacheMiddleware
+
+
+@pytest.fixture
+def cached_client():
+    """CacheMiddleware가 적용된 최소 앱"""
+    app = FastAPI()
+    calls = {"count": 0}
+
+    @app.get("/api/items")
+    async def items(q: str = ""):
+        calls["count"] += 1
+        return {"q": q, "count": calls["count"]}
+
+    @app.get("/api/text")
+    async def text():
+        calls["count"] += 1
+        return PlainTextResponse("plain")
+
+    @app.post("/api/items")
+    async def create_item():
+        calls["count"] += 1
+        return {"created": True}
+
+    app.add_middleware(CacheMiddleware, duration=60, max_entries=2)
+    return TestClient(app), calls
+
+
+class TestCacheMiddleware:
+    """CacheMiddleware 테스트"""
+
+    def test_miss_then_hit(self, cached_client):
+        """두 번째 GET 요청은 캐시에서 응답"""
+        client, calls = cached_client
+        first = client.get("/api/items?q=a")
+        second = client.get("/api/items?q=a")
+        assert first.headers["x-cache"] == "MISS"
+        assert second.headers["x-cache"] == "HIT"
+        assert second.headers["x-cache-ttl"] == "60"
+        assert second.json() == first.json()
+        assert calls["count"] == 1
+
+    def test_query_string_is_part_of_key(self, cached_client):
+        """쿼리 파라미터가 다르면 별도 캐시"""
+        client, calls = cached_client
+        client.get("/api/items?q=a")
+        response = client.get("/api/items?q=b")
+        assert response.headers["x-cache"] == "MISS"
+        assert calls["count"] == 2
+
+    def test_no_cache_header_bypasses(self, cached_client):
+        """Cache-Control: no-cache 요청은 캐시를 건너뜀"""
+        client, calls = cached_client
+        client.get("/api/items")
+        response = client.get("/api/items", headers={"Cache-Control": "no-cache"})
+        assert "x-cache" not in response.headers
+        assert calls["count"] == 2
+
+    def test_non_json_not_cached(self, cached_client):
+        """JSON이 아닌 응답은 캐싱하지 않음"""
+        client, calls = cached_client
+        client.get("/api/text")
+        response = client.get("/api/text")
+        assert response.text == "plain"
+        assert calls["count"] == 2
+
+    def test_post_not_cached(self, cached_client):
+        """POST 요청은 캐싱하지 않음"""
+        client, calls = cached_client
+        client.post("/api/items")
+        client.post("/api/items")
+        assert calls["count"] == 2
+
+    def test_max_entries(self, cached_client):
+        """최대 엔트리 수 초과 시 오래된 항목 제거"""
+        client, _ = cached_client
+        for q in ("a", "b", "c"):
+            client.get(f"/api/items?q={q}")
+        assert client.get("/api/items?q=a").headers["x-cache"] == "MISS"
+        assert client.get("/api/items?q=c").headers["x-cache"] == "HIT"
+
+    def test_skip_prefixes(self):
+        """제외 경로는 캐시를 거치지 않음"""
+        app = FastAPI()
+        calls = {"count": 0}
+
+        @app.get("/api/metrics/summary")
+        async def summary():
+            calls["count"] += 1
+            return {"count": calls["count"]}
+
+        app.add_middleware(CacheMiddleware, duration=60)
+        client = TestClient(app)
+        client.get("/api/metrics/summary")
+        response = client.get("/api/metrics/summary")
+        assert "x-cache" not in response.headers
+        assert response.json() == {"count": 2}
+
+    def test_shared_backend(self):
+        """외부 백엔드가 주어지면 메모리 대신 백엔드에 저장/조회"""
+
+        class DictBackend:
+            def __init__(self):
+                self.store = {}
+
+            async def get(self, cache_key):
+                return self.store.get(cache_key)
+
+            async def set(self, cache_key, status, headers, body, ttl):
+                self.store[cache_key] = (status, headers, body)
+
+        backend = DictBackend()
+        app = FastAPI()
+
+        @app.get("/api/items")
+        async def items():
+            return {"ok": True}
+
+        app.add_middleware(CacheMiddleware, duration=60, backend=backend)
+        client = TestClient(app)
+        assert client.get("/api/items").headers["x-cache"] == "MISS"
+        assert len(backend.store) == 1
+        response = client.get("/api/items")
+        assert response.headers["x-cache"] == "HIT"
+        assert response.json() == {"ok": True}
@@ -0,0 +1,97 @@
+"""
+프론트엔드 빌드 산출물 서빙 유틸리티 테스트
+"""
+import asyncio
+
+import pytest
+from backend.utils.frontend_assets import EarlyHintsResponse, FrontendAssets, make_weak_etag, get_media_type
+
+
+@pytest.fixture
+def build_dir(tmp_path):
+    """최소 SPA 빌드 디렉토리"""
+    (tmp_path / "index.html").write_bytes(b"<!DOCTYPE html><div id=root></div>")
+    assets = tmp_path / "assets"
+    assets.mkdir()
+    (assets / "index-abc123.js").write_text("console.log(1)")
+    (assets / "index-abc123.css").write_text("body{}")
+    return tmp_path
+
+
+class TestFrontendAssets:
+    """FrontendAssets 테스트"""
+
+    def test_weak_etag_is_stable(self):
+        """동일 콘텐츠는 동일한 약한 ETag"""
+        etag = make_weak_etag(b"hello")
+        assert etag == make_weak_etag(b"hello")
+        assert etag.startswith('W/"') and etag.endswith('"')
+        assert etag != make_weak_etag(b"world")
+
+    def test_load_preloads_index(self, build_dir):
+        """index.html bytes와 ETag 미리 로드"""
+        assets = FrontendAssets.load(build_dir)
+        assert assets is not None
+        assert assets.index_html == (build_dir / "index.html").read_bytes()
+        assert assets.index_etag == make_weak_etag(assets.index_html)
+
+    def test_load_without_index(self, tmp_path):
+        """index.html이 없으면 None"""
+        assert FrontendAssets.load(tmp_path) is None
+
+    def test_get_file(self, build_dir):
+        """존재하는 파일만 반환, 나머지는 SPA 폴백"""
+        assets = FrontendAssets.load(build_dir)
+        assert assets.get_file("assets/index-abc123.js") == build_dir / "assets" / "index-abc123.js"
+        assert assets.get_file("dashboard/settings") is None
+        assert assets.get_file("../secret") is None
+
+    def test_get_media_type(self):
+        """확장자 기반 MIME 타입 조회"""
+        assert get_media_type("assets/index-abc123.js") == "application/javascript; charset=utf-8"
+        assert get_media_type("assets/INDEX.CSS") == "text/css; charset=utf-8"
+        assert get_media_type("fonts/a.woff2") == "font/woff2"
+        assert get_media_type("data.bin") == "application/octet-stream"
+
+    def test_early_hints_for_entry_bundles(self, build_dir):
+        """엔트리 JS/CSS 번들만 preload 링크로 수집"""
+        (build_dir / "assets" / "vendor-xyz.js").write_text("")
+        assets = FrontendAssets.load(build_dir)
+        assert assets.early_hints == [
+            b"</app/assets/index-abc123.css>; rel=preload; as=style",
+            b"</app/assets/index-abc123.js>; rel=preload; as=script",
+        ]
+
+    def test_early_hints_sent_before_response_start(self):
+        """서버가 http.response.early_hint 확장을 지원하면 본 응답 전에 103 전송"""
+        links = [b"</app/assets/index-abc123.js>; rel=preload; as=script"]
+        sent = []
+
+        async def receive():
+            return {"type": "http.request"}
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {"type": "http", "extensions": {"http.response.early_hint": {}}}
+        response = EarlyHintsResponse(b"ok", early_hints=links)
+        asyncio.run(response(scope, receive, send))
+
+        types = [message["type"] for message in sent]
+        assert types[0] == "http.response.early_hint"
+        assert types.index("http.response.early_hint") < types.index("http.response.start")
+        assert sent[0]["links"] == links
+
+    def test_early_hints_skipped_without_extension(self):
+        """확장 미지원 서버에서는 일반 응답만 전송"""
+        sent = []
+
+        async def receive():
+            return {"type": "http.request"}
+
+        async def send(message):
+            sent.append(message)
+
+        response = EarlyHintsResponse(b"ok", early_hints=[b"</a.js>; rel=preload; as=script"])
+        asyncio.run(response({"type": "http"}, receive, send))
+        assert [message["type"] for message in sent] == ["http.response.start", "http.response.body"]
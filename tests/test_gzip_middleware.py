@@ -0,0 +1,47 @@
+"""
+GZip 미들웨어 테스트
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+from backend.middleware.gzip_middleware import StreamingAwareGZipMiddleware
+
+
+@pytest.fixture
+def gzip_client():
+    """StreamingAwareGZipMiddleware가 적용된 최소 앱"""
+    app = FastAPI()
+    body = "가나다라마바사 " * 200
+
+    @app.get("/api/large")
+    async def large():
+        return PlainTextResponse(body)
+
+    @app.post("/api/target/analyze/stream")
+    async def stream():
+        async def generate():
+            for _ in range(3):
+                yield body + "\n"
+        return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+    app.add_middleware(StreamingAwareGZipMiddleware, minimum_size=100)
+    return TestClient(app), body
+
+
+class TestStreamingAwareGZipMiddleware:
+    """StreamingAwareGZipMiddleware 테스트"""
+
+    def test_regular_response_compressed(self, gzip_client):
+        """일반 응답은 gzip으로 압축"""
+        client, body = gzip_client
+        response = client.get("/api/large", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.text == body
+
+    def test_stream_passthrough(self, gzip_client):
+        """스트리밍 경로는 압축하지 않고 그대로 전달"""
+        client, body = gzip_client
+        response = client.post("/api/target/analyze/stream", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in response.headers
+        assert response.text == (body + "\n") * 3
@@ -0,0 +1,66 @@
+"""
+사전 압축 정적 응답 테스트
+"""
+import asyncio
+import gzip
+import zlib
+from backend.utils.precompressed import PrecompressedAsset, parse_accept_encoding
+
+
+def _call(asset, method="GET", headers=None):
+    """ASGI 엔드포인트를 호출하고 전송된 메시지 목록 반환"""
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "method": method, "headers": headers or []}
+    asyncio.run(asset(scope, None, send))
+    return messages
+
+
+class TestParseAcceptEncoding:
+    """Accept-Encoding 파싱 테스트"""
+
+    def test_tokens(self):
+        """인코딩 목록 추출"""
+        scope = {"headers": [(b"accept-encoding", b"gzip, deflate, br")]}
+        assert parse_accept_encoding(scope) == {"gzip", "deflate", "br"}
+
+    def test_q_zero_excluded(self):
+        """q=0 인코딩 제외"""
+        scope = {"headers": [(b"accept-encoding", b"br;q=0, gzip;q=0.8")]}
+        assert parse_accept_encoding(scope) == {"gzip"}
+
+    def test_missing_header(self):
+        """헤더가 없으면 빈 집합"""
+        assert parse_accept_encoding({"headers": []}) == set()
+
+
+class TestPrecompressedAsset:
+    """PrecompressedAsset 테스트"""
+
+    def test_flush_at_splits_chunks(self):
+        """flush_at 위치까지를 독립적으로 해제 가능한 첫 청크로 전송"""
+        body = b"<head></head>" + b"<p>body</p>" * 50
+        asset = PrecompressedAsset(body, "text/html", flush_at=len(b"<head></head>"))
+        messages = _call(asset, headers=[(b"accept-encoding", b"gzip")])
+        chunks = [message["body"] for message in messages[1:]]
+        assert [message["more_body"] for message in messages[1:]] == [True, False]
+        assert zlib.decompressobj(31).decompress(chunks[0]) == b"<head></head>"
+        assert gzip.decompress(b"".join(chunks)) == body
+        headers = dict(messages[0]["headers"])
+        assert int(headers[b"content-length"]) == sum(len(chunk) for chunk in chunks)
+
+    def test_identity_without_flush(self):
+        """flush_at이 없으면 본문 한 번에 전송"""
+        asset = PrecompressedAsset(b"hello", "text/plain")
+        messages = _call(asset)
+        assert len(messages) == 2
+        assert messages[1]["body"] == b"hello"
+
+    def test_head_has_no_body(self):
+        """HEAD 요청은 빈 본문"""
+        asset = PrecompressedAsset(b"hello", "text/plain", flush_at=2)
+        messages = _call(asset, method="HEAD")
+        assert messages[1] == {"type": "http.response.body", "body": b"", "more_body": False}
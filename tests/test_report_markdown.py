@@ -0,0 +1,41 @@
+"""
+서버 측 Markdown 보고서 생성 테스트
+"""
+from backend.utils.report_markdown import render_report_markdown
+
+
+class TestRenderReportMarkdown:
+    """render_report_markdown 테스트"""
+
+    def test_header_and_sections(self):
+        """헤더, 섹션 제목, 중첩 값이 Markdown 리스트로 출력"""
+        text = render_report_markdown({
+            "target_keyword": "전기차",
+            "target_type": "keyword",
+            "key_findings": {"primary_insights": ["충전 인프라", "보조금"]},
+            "execution_roadmap": {"phase_1": {"market_size": "large"}},
+        })
+        assert text.startswith("# 타겟 분석 보고서\n\n**분석 대상**: 전기차\n**분석 유형**: 키워드 분석\n")
+        assert "## 주요 발견사항 (Key Findings)\n\n- **Primary Insights**:\n  1. 충전 인프라\n  2. 보조금\n" in text
+        assert "- **Phase 1**:\n  - **Market Size**: large\n" in text
+        assert text.endswith("*본 보고서는 AI 기반 분석 결과입니다.*\n")
+
+    def test_summary_dedupes_and_drops_warnings(self):
+        """Executive Summary는 중복 줄과 API 키 경고 문구를 제외"""
+        text = render_report_markdown({
+            "executive_summary": "요약 A\n요약 A\n⚠️ AI API 키가 설정되지 않아 기본 분석 모드입니다.\n요약 B",
+        })
+        assert "## Executive Summary\n\n요약 A\n요약 B\n\n" in text
+        assert "⚠️" not in text
+
+    def test_empty_sections_skipped(self):
+        """값이 없는 섹션은 제목도 출력하지 않음"""
+        text = render_report_markdown({"appendix": {}, "sentiment": None, "summary": ""})
+        assert "## 부록" not in text
+        assert "## Executive Summary" not in text
+
+    def test_report_object_preferred(self):
+        """report 객체가 있으면 본문으로 사용"""
+        text = render_report_markdown({"report": {"appendix": {"sources": ["a"]}}, "appendix": {"sources": ["b"]}})
+        assert "1. a" in text
+        assert "1. b" not in text
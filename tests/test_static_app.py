@@ -0,0 +1,152 @@
+"""
+랜딩 페이지 스크립트(backend/static/app.js) 보고서 헬퍼 테스트
+
+app.js에서 필요한 최상위 선언만 꺼내 node로 실행합니다 (node가 없으면 건너뜀).
+"""
+import json
+import re
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+APP_JS = Path(__file__).resolve().parents[1] / "backend" / "static" / "app.js"
+NODE = shutil.which("node")
+
+pytestmark = pytest.mark.skipif(NODE is None, reason="node가 설치되어 있지 않음")
+
+# 여러 줄 선언의 끝 (열 0에서 닫는 괄호로 시작하는 줄)
+_DECLARATION_END_RE = re.compile(r"^[}\]].*$", re.M)
+
+
+def _declaration(source: str, name: str) -> str:
+    """app.js에서 최상위 선언(const/function/class) 하나의 소스 추출"""
+    match = re.search(rf"^(?:const|function|class) {re.escape(name)}\b", source, re.M)
+    assert match, f"{name} 선언을 찾을 수 없음"
+    line_end = source.index("\n", match.start())
+    if source[match.start():line_end].rstrip().endswith(";"):
+        return source[match.start():line_end]
+    end = _DECLARATION_END_RE.search(source, line_end)
+    return source[match.start():end.end()]
+
+
+def run_app_js(names, body: str):
+    """선언 목록을 불러온 뒤 body를 실행하고 반환값을 JSON으로 받아옴"""
+    source = APP_JS.read_text(encoding="utf-8")
+    script = "\n".join(_declaration(source, name) for name in names)
+    script += "\nprocess.stdout.write(JSON.stringify((() => {\n" + body + "\n})()));\n"
+    result = subprocess.run([NODE, "-e", script], capture_output=True, text=True, timeout=30)
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout)
+
+
+class TestMapKeys:
+    """mapKeys 별칭 키 매핑 테스트"""
+
+    NAMES = ["ENGLISH_KEY_MAPPING", "KOREAN_KEY_MAPPING", "CAMEL_CASE_KEY_MAPPING", "KEY_ALIASES", "mapKeys"]
+
+    def test_colliding_aliases_follow_table_order(self):
+        """같은 표준 키의 별칭이 여럿이면 응답 순서가 아니라 별칭 표 순서로 선택"""
+        result = run_app_js(self.NAMES, """
+            return [
+                mapKeys({"전략적 시사점": "텍스트", "전략 제안": {subsections: ["a"]}}).strategic_recommendations,
+                mapKeys({"분석 개요": "한글", "Analysis Overview": "영문"}).analysis_overview,
+                mapKeys({"strategicRecommendations": "camel", "Strategic Recommendations": "영문"}).strategic_recommendations,
+            ];
+        """)
+        assert result == [{"subsections": ["a"]}, "영문", "영문"]
+
+    def test_existing_canonical_key_kept(self):
+        """이미 값이 있는 표준 키는 덮어쓰지 않고, 별칭이 없으면 원본을 그대로 반환"""
+        result = run_app_js(self.NAMES, """
+            const plain = {executive_summary: "요약"};
+            return [
+                mapKeys({executive_summary: "원본", "Executive Summary": "별칭"}).executive_summary,
+                mapKeys(plain) === plain,
+            ];
+        """)
+        assert result == ["원본", True]
+
+
+class TestNdjsonReader:
+    """NdjsonReader 스트림 파싱 테스트"""
+
+    def test_malformed_line_skipped(self):
+        """잘못된 줄(NaN 등)은 경고만 남기고 건너뛰며 나머지 이벤트는 계속 파싱"""
+        result = run_app_js(["NdjsonReader"], """
+            const warnings = [];
+            console.warn = (...args) => warnings.push(String(args[0]));
+            const reader = new NdjsonReader();
+            const events = reader.feed('{"type":"progress"}\\n{"score": NaN}\\n{"type":"comp');
+            events.push(...reader.feed('lete"}\\n'));
+            return [events.map(e => e.type), warnings.length];
+        """)
+        assert result == [["progress", "complete"], 1]
+
+
+class TestEmitNumberedList:
+    """emitNumberedList 번호 목록 출력 테스트"""
+
+    NAMES = ["ORDINALS", "ordinal", "emitNumberedList", "appendValueForReport", "formatValueLines", "splitReportLines"]
+
+    def test_array_items_numbered(self):
+        """배열 항목마다 "1. " 번호를 붙이고 빈 줄로 마무리"""
+        result = run_app_js(self.NAMES, """
+            const parts = [];
+            emitNumberedList(parts, ["가", "나"]);
+            return parts.join("");
+        """)
+        assert result == "1. 가\\n2. 나\\n\\n"
+
+    def test_string_value_as_paragraph(self):
+        """문자열 값은 글자마다 번호를 붙이지 않고 한 문단으로 출력"""
+        result = run_app_js(self.NAMES, """
+            const parts = [];
+            emitNumberedList(parts, "- item");
+            return parts.join("");
+        """)
+        assert result == "- item\\n\\n"
+
+
+class TestDirectSections:
+    """영문/한글 직접 키 섹션 출력 테스트"""
+
+    NAMES = [
+        "SKIP_SECTION_KEYS", "ORDINALS", "ordinal", "isObjectRecord", "pushInsightList", "DIRECT_SECTIONS",
+        "pushDirectSection", "pushValueSection", "appendValueForReport", "formatValueLines", "splitReportLines",
+    ]
+
+    def test_overview_array_rendered_per_index(self):
+        """분석 개요 배열은 인덱스마다 "### 0" 섹션으로 출력 (빈 값은 생략)"""
+        result = run_app_js(self.NAMES, """
+            const parts = [];
+            pushDirectSection(parts, DIRECT_SECTIONS[0], ["첫째", "", "셋째"]);
+            return parts.join("");
+        """)
+        assert result == "## Analysis Overview\\n\\n### 0\\n\\n첫째\\n\\n### 2\\n\\n셋째\\n\\n"
+
+    def test_key_insights_array_uses_insight_list(self):
+        """Key Insights 배열은 인사이트 목록으로 출력"""
+        result = run_app_js(self.NAMES, """
+            const parts = [];
+            const section = DIRECT_SECTIONS.find(s => s.key === "Key Insights");
+            pushDirectSection(parts, section, [{insight: "가", evidence: "근거1"}, "나"]);
+            return parts.join("");
+        """)
+        assert result == "## Key Insights\\n\\n### 가\\n\\n- **근거**: 근거1\\n\\n2. 나\\n\\n"
+
+
+class TestPushFindingItems:
+    """pushFindingItems Key Findings 배열 출력 테스트"""
+
+    NAMES = ["ORDINALS", "ordinal", "pushFindingItems", "appendValueForReport", "formatValueLines", "splitReportLines"]
+
+    def test_korean_keys_and_null_items(self):
+        """한글 키 인사이트 객체를 출력하고 null 항목은 번호 목록으로 처리"""
+        result = run_app_js(self.NAMES, """
+            const parts = [];
+            pushFindingItems(parts, [{"인사이트": "가", "근거": "근거1"}, null]);
+            return parts.join("");
+        """)
+        assert result == "### 가\\n\\n- **근거**: 근거1\\n\\n2. null\\n"
@@ -1,11 +1,16 @@
 """
 타겟 분석 서비스 테스트 (Mock 기반)
 """
+import os
+import sys
+from types import ModuleType, SimpleNamespace
+
 import pytest
 from unittest.mock import patch, AsyncMock, MagicMock
 from backend.services.target_analyzer import (
     analyze_target,
     _analyze_basic,
+    _analyze_with_gemini_stream,
     _build_system_message,
     _build_analysis_prompt,
 )
@@ -95,6 +100,56 @@ class TestAnalyzeTarget:
             assert result is not None
 
 
+class _IterableStream:
+    """iter()만 지원하고 next()는 지원하지 않는 스트림 응답 (GenerateContentResponse와 같은 형태)"""
+
+    def __init__(self, texts):
+        self.texts = texts
+
+    def __iter__(self):
+        return iter([SimpleNamespace(text=text) for text in self.texts])
+
+
+STREAM_TEXTS = ['{"executive_summary": "스트림 요약입니다.', ' 두 번째 문장."}']
+
+
+async def _collect_gemini_stream():
+    return [event async for event in _analyze_with_gemini_stream("테스트", "keyword", None)]
+
+
+class TestGeminiStream:
+    """Gemini 스트리밍 분석 테스트"""
+
+    async def test_stream_accepts_iterable_response(self):
+        """google.genai 스트림 응답이 이터레이터가 아닌 iterable이어도 순회"""
+        google = ModuleType("google")
+        google.genai = SimpleNamespace(Client=MagicMock())
+        with patch.dict(os.environ, {"GEMINI_API_KEY": "test-key"}), \
+             patch.dict(sys.modules, {"google": google, "google.genai": google.genai}), \
+             patch('backend.services.target_analyzer.generate_content_stream_with_fallback',
+                   new_callable=AsyncMock, return_value=_IterableStream(STREAM_TEXTS)):
+            events = await _collect_gemini_stream()
+
+        assert not [event for event in events if event["type"] == "error"]
+        assert events[-1]["type"] == "complete"
+        assert events[-1]["data"]["executive_summary"] == "스트림 요약입니다. 두 번째 문장."
+
+    async def test_legacy_sdk_stream_accepts_iterable_response(self):
+        """google.generativeai fallback의 GenerateContentResponse(iterable)도 순회"""
+        model = MagicMock()
+        model.generate_content.return_value = _IterableStream(STREAM_TEXTS)
+        google = ModuleType("google")
+        google.generativeai = SimpleNamespace(configure=MagicMock(), GenerativeModel=MagicMock(return_value=model))
+        with patch.dict(os.environ, {"GEMINI_API_KEY": "test-key"}), \
+             patch.dict(sys.modules, {"google": google, "google.generativeai": google.generativeai}):
+            events = await _collect_gemini_stream()
+
+        assert not [event for event in events if event["type"] == "error"]
+        assert events[-1]["type"] == "complete"
+        assert events[-1]["data"]["executive_summary"] == "스트림 요약입니다. 두 번째 문장."
+        assert model.generate_content.call_args.kwargs["stream"] is True
+
+
 class TestAnalyzeBasic:
     """기본 분석 함수 테스트"""
     